@@ -0,0 +1,26 @@
+-- =====================================================
+-- Add composite (project_id, notes) index to archon_project_sources
+-- =====================================================
+-- Project source links are always read, replaced and deleted per project
+-- and link type (notes = 'technical' / 'business'). Including source_id
+-- lets these lookups be answered from the index alone.
+--
+-- The composite index also serves plain project_id lookups, so the
+-- single-column project_id index is dropped.
+--
+-- SAFE & IDEMPOTENT: Can be run multiple times without issues
+-- =====================================================
+
+CREATE INDEX IF NOT EXISTS idx_archon_project_sources_project_id_notes
+ON archon_project_sources(project_id, notes) INCLUDE (source_id);
+
+DROP INDEX IF EXISTS idx_archon_project_sources_project_id;
+
+-- Record migration application for tracking
+INSERT INTO archon_migrations (version, migration_name)
+VALUES ('0.1.0', '012_add_project_sources_notes_index')
+ON CONFLICT (version, migration_name) DO NOTHING;
+
+-- =====================================================
+-- MIGRATION COMPLETE
+-- =====================================================
@@ -0,0 +1,28 @@
+-- =====================================================
+-- Add trigram index for task keyword search
+-- =====================================================
+-- Task search matches a substring anywhere in the title, description or
+-- feature. A leading-wildcard LIKE cannot use a B-tree index, so every
+-- search scanned the whole archon_tasks table. A pg_trgm GIN index on the
+-- combined text serves these ILIKE '%term%' predicates directly.
+--
+-- The indexed expression must match the one used by the task service.
+--
+-- SAFE & IDEMPOTENT: Can be run multiple times without issues
+-- =====================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_archon_tasks_search_trgm
+ON archon_tasks USING GIN (
+  (coalesce(title, '') || ' ' || coalesce(description, '') || ' ' || coalesce(feature, '')) gin_trgm_ops
+);
+
+-- Record migration application for tracking
+INSERT INTO archon_migrations (version, migration_name)
+VALUES ('0.1.0', '013_add_tasks_search_trgm_index')
+ON CONFLICT (version, migration_name) DO NOTHING;
+
+-- =====================================================
+-- MIGRATION COMPLETE
+-- =====================================================
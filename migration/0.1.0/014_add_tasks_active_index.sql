@@ -0,0 +1,26 @@
+-- =====================================================
+-- Add partial index for active (non-archived) tasks
+-- =====================================================
+-- Task listing, position inserts and the per-project task counts all
+-- filter out archived tasks and then narrow by project and status,
+-- ordering by task_order and created_at. This partial index matches
+-- those queries and leaves archived tasks out of the index entirely.
+--
+-- Its leading (project_id, status) columns also serve the grouped task
+-- counts, so no separate counts index is needed.
+--
+-- SAFE & IDEMPOTENT: Can be run multiple times without issues
+-- =====================================================
+
+CREATE INDEX IF NOT EXISTS idx_archon_tasks_active
+ON archon_tasks(project_id, status, task_order, created_at)
+WHERE archived IS NULL OR archived = false;
+
+-- Record migration application for tracking
+INSERT INTO archon_migrations (version, migration_name)
+VALUES ('0.1.0', '014_add_tasks_active_index')
+ON CONFLICT (version, migration_name) DO NOTHING;
+
+-- =====================================================
+-- MIGRATION COMPLETE
+-- =====================================================
@@ -0,0 +1,40 @@
+-- =====================================================
+-- Enforce unique version numbers per project field
+-- =====================================================
+-- The existing UNIQUE(project_id, task_id, field_name, version_number)
+-- constraint never fires for project versions: task_id is NULL for them,
+-- and NULLs compare as distinct. This index makes a duplicate version
+-- number an error and also serves the MAX(version_number) lookup used to
+-- number new versions.
+--
+-- Databases that already contain duplicate numbers keep working without
+-- the index; a notice is raised so they can be cleaned up and the
+-- migration re-run.
+--
+-- SAFE & IDEMPOTENT: Can be run multiple times without issues
+-- =====================================================
+
+DO $$
+BEGIN
+  IF EXISTS (
+    SELECT 1 FROM archon_document_versions
+    WHERE project_id IS NOT NULL
+    GROUP BY project_id, field_name, version_number
+    HAVING count(*) > 1
+  ) THEN
+    RAISE NOTICE 'Duplicate document version numbers found; skipping unique index';
+  ELSE
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_archon_document_versions_project_field_version
+    ON archon_document_versions(project_id, field_name, version_number)
+    WHERE project_id IS NOT NULL;
+  END IF;
+END $$;
+
+-- Record migration application for tracking
+INSERT INTO archon_migrations (version, migration_name)
+VALUES ('0.1.0', '015_add_document_versions_unique_index')
+ON CONFLICT (version, migration_name) DO NOTHING;
+
+-- =====================================================
+-- MIGRATION COMPLETE
+-- =====================================================
@@ -950,13 +950,20 @@ CREATE INDEX IF NOT EXISTS idx_archon_tasks_order ON archon_tasks(task_order);
 CREATE INDEX IF NOT EXISTS idx_archon_tasks_priority ON archon_tasks(priority);
 CREATE INDEX IF NOT EXISTS idx_archon_tasks_archived ON archon_tasks(archived);
 CREATE INDEX IF NOT EXISTS idx_archon_tasks_archived_at ON archon_tasks(archived_at);
-CREATE INDEX IF NOT EXISTS idx_archon_project_sources_project_id ON archon_project_sources(project_id);
+CREATE INDEX IF NOT EXISTS idx_archon_tasks_active ON archon_tasks(project_id, status, task_order, created_at)
+  WHERE archived IS NULL OR archived = false;
+CREATE INDEX IF NOT EXISTS idx_archon_tasks_search_trgm ON archon_tasks USING GIN (
+  (coalesce(title, '') || ' ' || coalesce(description, '') || ' ' || coalesce(feature, '')) gin_trgm_ops
+);
+CREATE INDEX IF NOT EXISTS idx_archon_project_sources_project_id_notes ON archon_project_sources(project_id, notes) INCLUDE (source_id);
 CREATE INDEX IF NOT EXISTS idx_archon_project_sources_source_id ON archon_project_sources(source_id);
 CREATE INDEX IF NOT EXISTS idx_archon_document_versions_project_id ON archon_document_versions(project_id);
 CREATE INDEX IF NOT EXISTS idx_archon_document_versions_task_id ON archon_document_versions(task_id);
 CREATE INDEX IF NOT EXISTS idx_archon_document_versions_field_name ON archon_document_versions(field_name);
 CREATE INDEX IF NOT EXISTS idx_archon_document_versions_version_number ON archon_document_versions(version_number);
 CREATE INDEX IF NOT EXISTS idx_archon_document_versions_created_at ON archon_document_versions(created_at);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_archon_document_versions_project_field_version
+  ON archon_document_versions(project_id, field_name, version_number) WHERE project_id IS NOT NULL;
 
 -- Apply triggers to tables
 CREATE OR REPLACE TRIGGER update_archon_projects_updated_at
@@ -1062,7 +1069,11 @@ VALUES
   ('0.1.0', '008_add_migration_tracking'),
   ('0.1.0', '009_add_cascade_delete_constraints'),
   ('0.1.0', '010_add_provider_placeholders'),
-  ('0.1.0', '011_add_page_metadata_table')
+  ('0.1.0', '011_add_page_metadata_table'),
+  ('0.1.0', '012_add_project_sources_notes_index'),
+  ('0.1.0', '013_add_tasks_search_trgm_index'),
+  ('0.1.0', '014_add_tasks_active_index'),
+  ('0.1.0', '015_add_document_versions_unique_index')
 ON CONFLICT (version, migration_name) DO NOTHING;
 
 -- Enable Row Level Security on migrations table
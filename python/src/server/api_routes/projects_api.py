@@ -13,8 +13,9 @@ from datetime import datetime, timezone
 from email.utils import format_datetime
 from typing import Any
 
-from fastapi import APIRouter, Header, HTTPException, Request, Response
+from fastapi import APIRouter, Header, HTTPException, Query, Request, Response
 from fastapi import status as http_status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 # Removed direct logging import - using unified config
@@ -332,6 +333,48 @@ async def get_all_task_counts(
         raise HTTPException(status_code=500, detail={"error": str(e)})
 
 
+@router.get("/projects/stream")
+async def stream_projects():
+    """
+    Stream all projects with full content as NDJSON (one project per line).
+
+    Intended for large project lists: the response starts immediately and
+    memory stays flat regardless of how much docs/features/data there is.
+    """
+    logfire.debug("Streaming projects as NDJSON")
+
+    project_service = ProjectService()
+    return StreamingResponse(
+        project_service.iter_projects_ndjson(), media_type="application/x-ndjson"
+    )
+
+
+@router.get("/projects/details")
+async def get_projects_details(ids: list[str] = Query(...)):
+    """
+    Get full details for several projects in a single request.
+
+    Used by views that open many projects at once, avoiding one request and
+    query per project. Unknown IDs are omitted from the result.
+    """
+    try:
+        logfire.debug(f"Getting project details | count={len(ids)}")
+
+        project_service = ProjectService()
+        success, result = await project_service.get_projects_bulk(ids)
+
+        if not success:
+            raise HTTPException(status_code=500, detail=result)
+
+        return result
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logfire.error(f"Failed to get project details | error={str(e)}")
+        raise HTTPException(status_code=500, detail={"error": str(e)})
+
+
 @router.get("/projects/{project_id}")
 async def get_project(project_id: str):
     """Get a specific project."""
@@ -406,26 +449,25 @@ async def update_project(project_id: str, request: UpdateProjectRequest):
 
                 if success and current_result.get("project"):
                     current_project = current_result["project"]
-                    version_count = 0
+                    snapshots = []
 
-                    # Create versions for updated JSONB fields
+                    # Snapshot updated JSONB fields whose content actually changed
                     for field_name in ["docs", "features", "data"]:
                         if field_name in update_fields:
                             current_content = current_project.get(field_name, {})
-                            new_content = update_fields[field_name]
-
-                            # Only create version if content actually changed
-                            if current_content != new_content:
-                                v_success, _ = versioning_service.create_version(
-                                    project_id=project_id,
-                                    field_name=field_name,
-                                    content=current_content,
-                                    change_summary=f"Updated {field_name} via API",
-                                    change_type="update",
-                                    created_by="api_user",
-                                )
-                                if v_success:
-                                    version_count += 1
+                            if current_content != update_fields[field_name]:
+                                snapshots.append({
+                                    "project_id": project_id,
+                                    "field_name": field_name,
+                                    "content": current_content,
+                                    "change_summary": f"Updated {field_name} via API",
+                                    "change_type": "update",
+                                    "created_by": "api_user",
+                                })
+
+                    # All snapshots go in with one insert
+                    v_success, v_result = await versioning_service.create_versions_bulk(snapshots)
+                    version_count = v_result["count"] if v_success else 0
 
                     logfire.info(f"Created {version_count} version snapshots before update")
             except ImportError:
@@ -646,6 +688,31 @@ async def list_project_tasks(
         raise HTTPException(status_code=500, detail={"error": str(e)})
 
 
+@router.get("/projects/{project_id}/dashboard")
+async def get_project_dashboard(project_id: str):
+    """Get a project's tasks (without large fields) together with its task counts."""
+    try:
+        logfire.debug(f"Getting project dashboard | project_id={project_id}")
+
+        task_service = TaskService()
+        success, result = await task_service.get_project_dashboard(project_id)
+
+        if not success:
+            raise HTTPException(status_code=500, detail=result)
+
+        logfire.debug(
+            f"Project dashboard retrieved | project_id={project_id} | task_count={len(result['tasks'])}"
+        )
+
+        return result
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logfire.error(f"Failed to get project dashboard | project_id={project_id}", exc_info=True)
+        raise HTTPException(status_code=500, detail={"error": str(e)})
+
+
 # Remove the complex /tasks endpoint - it's not needed and breaks things
 
 
@@ -1135,7 +1202,7 @@ async def list_project_versions(project_id: str, field_name: str = None):
 
         # Use VersioningService to list versions
         versioning_service = VersioningService()
-        success, result = versioning_service.list_versions(project_id, field_name)
+        success, result = await versioning_service.list_versions(project_id, field_name)
 
         if not success:
             if "not found" in result.get("error", "").lower():
@@ -1166,7 +1233,7 @@ async def create_project_version(project_id: str, request: CreateVersionRequest)
 
         # Use VersioningService to create version
         versioning_service = VersioningService()
-        success, result = versioning_service.create_version(
+        success, result = await versioning_service.create_version(
             project_id=project_id,
             field_name=request.field_name,
             content=request.content,
@@ -1205,7 +1272,7 @@ async def get_project_version(project_id: str, field_name: str, version_number:
 
         # Use VersioningService to get version content
         versioning_service = VersioningService()
-        success, result = versioning_service.get_version_content(
+        success, result = await versioning_service.get_version_content(
             project_id, field_name, version_number
         )
 
@@ -1242,7 +1309,7 @@ async def restore_project_version(
 
         # Use VersioningService to restore version
         versioning_service = VersioningService()
-        success, result = versioning_service.restore_version(
+        success, result = await versioning_service.restore_version(
             project_id=project_id,
             field_name=field_name,
             version_number=version_number,
@@ -44,7 +44,11 @@ def get_database_mode() -> str:
 
 def is_asyncpg_mode() -> bool:
     """Check if using asyncpg mode."""
-    return get_database_mode() == "asyncpg"
+    # Read the cached mode directly once resolved; only the first call pays for env lookups
+    mode = _database_mode
+    if mode is None:
+        mode = get_database_mode()
+    return mode == "asyncpg"
 
 
 def get_supabase_client():
@@ -11,6 +11,7 @@ from contextlib import asynccontextmanager
 from typing import Any
 
 import asyncpg
+import orjson
 from asyncpg import Pool
 
 from ...config.logfire_config import get_logger
@@ -18,6 +19,37 @@ from .client import DatabaseClient
 
 logger = get_logger(__name__)
 
+# Binary JSONB wire format: a version byte followed by the JSON text
+_JSONB_VERSION = b"\x01"
+
+
+def _encode_jsonb(value: Any) -> bytes:
+    """
+    Encode a Python value as binary JSONB.
+
+    Strings are treated as already-serialized JSON so call sites that pass
+    json.dumps() output keep working unchanged.
+    """
+    if isinstance(value, str):
+        return _JSONB_VERSION + value.encode()
+    return _JSONB_VERSION + orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _decode_jsonb(data: bytes) -> Any:
+    """Decode binary JSONB into Python objects."""
+    return orjson.loads(data[1:])
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """Register per-connection codecs so JSONB columns arrive already parsed."""
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=_encode_jsonb,
+        decoder=_decode_jsonb,
+        schema="pg_catalog",
+        format="binary",
+    )
+
 
 class AsyncPGClient(DatabaseClient):
     """
@@ -75,6 +107,7 @@ class AsyncPGClient(DatabaseClient):
                                 max_size=10,
                                 command_timeout=60,
                                 statement_cache_size=0,
+                                init=_init_connection,
                             )
                             logger.info(f"AsyncPG pool created (host: {postgres_host})")
                         else:
@@ -85,6 +118,7 @@ class AsyncPGClient(DatabaseClient):
                                 max_size=10,
                                 command_timeout=60,
                                 statement_cache_size=0,
+                                init=_init_connection,
                             )
                             logger.info("AsyncPG pool created (DATABASE_URL)")
                     except Exception as e:
@@ -107,6 +141,23 @@ class AsyncPGClient(DatabaseClient):
         async with pool.acquire() as conn:
             yield conn
 
+    @classmethod
+    @asynccontextmanager
+    async def transaction(cls):
+        """
+        Get a pooled connection with an open transaction as a context manager.
+
+        The transaction commits when the block exits normally and rolls back
+        if it raises.
+
+        Usage:
+            async with AsyncPGClient.transaction() as conn:
+                await conn.execute("UPDATE ...")
+                await conn.execute("INSERT ...")
+        """
+        async with cls.connection() as conn, conn.transaction():
+            yield conn
+
     @classmethod
     async def fetch(cls, query: str, *args) -> list[dict[str, Any]]:
         """
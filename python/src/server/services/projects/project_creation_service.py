@@ -11,8 +11,10 @@ import json
 from datetime import UTC, datetime
 from typing import Any
 
+import asyncpg
+
 from ...config.logfire_config import get_logger
-from ..client_manager import get_database_mode, is_asyncpg_mode
+from ..client_manager import get_database_mode
 
 logger = get_logger(__name__)
 
@@ -24,6 +26,12 @@ class ProjectCreationService:
         """Initialize with optional supabase client (legacy mode only)"""
         self._supabase_client = supabase_client
         self._mode = get_database_mode()
+        # Bind the backend implementation once; the database mode is fixed for the process
+        self._create_impl = (
+            self._create_project_with_ai_asyncpg
+            if self._mode == "asyncpg"
+            else self._create_project_with_ai_supabase
+        )
 
     @property
     def supabase_client(self):
@@ -57,20 +65,28 @@ class ProjectCreationService:
             Tuple of (success, result_dict)
         """
         logger.info(
-            f"🏗️ [PROJECT-CREATION] Starting create_project_with_ai for progress_id: {progress_id}, title: {title}"
+            "🏗️ [PROJECT-CREATION] Starting create_project_with_ai for progress_id: %s, title: %s",
+            progress_id,
+            title,
         )
         try:
-            if is_asyncpg_mode():
-                return await self._create_project_with_ai_asyncpg(
-                    progress_id, title, description, github_repo, **kwargs
-                )
-            else:
-                return await self._create_project_with_ai_supabase(
-                    progress_id, title, description, github_repo, **kwargs
-                )
+            return await self._create_impl(progress_id, title, description, github_repo, **kwargs)
+        except (asyncpg.PostgresError, RuntimeError, ValueError) as e:
+            # Expected failures (database errors, empty inserts, misconfiguration) carry
+            # enough context in the message itself; skip traceback capture
+            logger.error(
+                "🚨 [PROJECT-CREATION] Project creation failed for progress_id=%s, title=%s: %s",
+                progress_id,
+                title,
+                e,
+            )
+            return False, {"error": str(e)}
         except Exception as e:
             logger.error(
-                f"🚨 [PROJECT-CREATION] Project creation failed for progress_id={progress_id}, title={title}: {e}",
+                "🚨 [PROJECT-CREATION] Unexpected error creating project for progress_id=%s, title=%s: %s",
+                progress_id,
+                title,
+                e,
                 exc_info=True,
             )
             return False, {"error": str(e)}
@@ -110,7 +126,7 @@ class ProjectCreationService:
             raise RuntimeError(f"Insert returned no data for project '{title}'")
 
         project_id = str(project["id"])
-        logger.info(f"Created project {project_id} in database")
+        logger.info("Created project %s in database", project_id)
 
         # Generate AI documentation if API key is available
         ai_success = await self._generate_ai_documentation(
@@ -124,38 +140,36 @@ class ProjectCreationService:
         )
 
         if final_project:
-            final_project_dict = dict(final_project)
-
             # Handle JSONB fields
-            docs = final_project_dict.get("docs", [])
+            docs = final_project.get("docs", [])
             if isinstance(docs, str):
                 docs = json.loads(docs)
-            features = final_project_dict.get("features", {})
+            features = final_project.get("features", {})
             if isinstance(features, str):
                 features = json.loads(features)
-            data = final_project_dict.get("data", {})
+            data = final_project.get("data", {})
             if isinstance(data, str):
                 data = json.loads(data)
 
             # Convert datetime
-            created_at = final_project_dict.get("created_at", "")
-            updated_at = final_project_dict.get("updated_at", "")
+            created_at = final_project.get("created_at", "")
+            updated_at = final_project.get("updated_at", "")
             if hasattr(created_at, "isoformat"):
                 created_at = created_at.isoformat()
             if hasattr(updated_at, "isoformat"):
                 updated_at = updated_at.isoformat()
 
             project_data_for_frontend = {
-                "id": str(final_project_dict["id"]),
-                "title": final_project_dict["title"],
-                "description": final_project_dict.get("description", ""),
-                "github_repo": final_project_dict.get("github_repo"),
+                "id": str(final_project["id"]),
+                "title": final_project["title"],
+                "description": final_project.get("description", ""),
+                "github_repo": final_project.get("github_repo"),
                 "created_at": created_at,
                 "updated_at": updated_at,
                 "docs": docs,
                 "features": features,
                 "data": data,
-                "pinned": final_project_dict.get("pinned", False),
+                "pinned": final_project.get("pinned", False),
                 "technical_sources": [],
                 "business_sources": [],
             }
@@ -204,7 +218,7 @@ class ProjectCreationService:
             raise RuntimeError(f"Insert returned no data for project '{title}'")
 
         project_id = response.data[0]["id"]
-        logger.info(f"Created project {project_id} in database")
+        logger.info("Created project %s in database", project_id)
 
         # Generate AI documentation if API key is available
         ai_success = await self._generate_ai_documentation(
@@ -301,6 +315,6 @@ class ProjectCreationService:
                 return False
 
         except Exception as ai_error:
-            logger.warning(f"AI generation failed, continuing with basic project: {ai_error}")
+            logger.warning("AI generation failed, continuing with basic project: %s", ai_error)
 
             return False
@@ -8,23 +8,127 @@ separating business logic from transport-specific code.
 Supports both asyncpg (K8s) and Supabase (legacy) database backends.
 """
 
-import json
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Any
+from uuid import UUID
+
+import orjson
+from postgrest.exceptions import APIError
 
 from ...config.logfire_config import get_logger
-from ..client_manager import get_database_mode, is_asyncpg_mode
+from ..client_manager import get_database_mode
+from ..database import AsyncPGClient
+from .task_service import invalidate_task_caches
 
 logger = get_logger(__name__)
 
+# Fields callers may change through update_project
+_ALLOWED_UPDATE_FIELDS = frozenset({
+    "title",
+    "description",
+    "github_repo",
+    "docs",
+    "features",
+    "data",
+    "technical_sources",
+    "business_sources",
+    "pinned",
+})
+
+# Columns of archon_projects that make up a project's API representation
+_PROJECT_COLUMNS = (
+    "id, title, description, docs, features, data, github_repo, pinned, created_at, updated_at"
+)
+
+# Full project listing columns with NULLs replaced by their API defaults, shared
+# by list_projects(include_content=True) and the NDJSON stream
+_PROJECT_CONTENT_COLUMNS = """
+    id::text AS id, title, github_repo, created_at, updated_at,
+    COALESCE(pinned, false) AS pinned,
+    COALESCE(description, '') AS description,
+    COALESCE(docs, '[]'::jsonb) AS docs,
+    COALESCE(features, '[]'::jsonb) AS features,
+    COALESCE(data, '[]'::jsonb) AS data
+"""
+
+# Project row plus its linked sources, aggregated per link type as JSONB arrays
+_PROJECT_WITH_SOURCES_SQL = f"""
+    SELECT {_PROJECT_COLUMNS},
+        COALESCE((
+            SELECT jsonb_agg(to_jsonb(s.*))
+            FROM archon_project_sources ps
+            JOIN archon_sources s ON s.source_id = ps.source_id
+            WHERE ps.project_id = p.id AND ps.notes = 'technical'
+        ), '[]'::jsonb) AS technical_sources,
+        COALESCE((
+            SELECT jsonb_agg(to_jsonb(s.*))
+            FROM archon_project_sources ps
+            JOIN archon_sources s ON s.source_id = ps.source_id
+            WHERE ps.project_id = p.id AND ps.notes = 'business'
+        ), '[]'::jsonb) AS business_sources
+    FROM archon_projects p
+"""
+
+
+def _format_project_row(project: dict[str, Any]) -> dict[str, Any]:
+    """Convert a fetched project row in place into its API representation."""
+    project["id"] = str(project["id"])
+
+    created_at = project["created_at"]
+    if isinstance(created_at, datetime):
+        project["created_at"] = created_at.isoformat()
+    updated_at = project["updated_at"]
+    if isinstance(updated_at, datetime):
+        project["updated_at"] = updated_at.isoformat()
+
+    # JSONB fields arrive already decoded; only NULLs need defaults
+    for field in ("docs", "features", "data", "technical_sources", "business_sources"):
+        if project.get(field) is None:
+            project[field] = []
+
+    return project
+
+
+# Applies a JSONB patch ($2) to a project. Only one project can be pinned at a
+# time, so pinning also unpins the others within the same statement. JSON nulls
+# in docs/features/data are stored as empty arrays.
+_UPDATE_PROJECT_SQL = f"""
+    WITH unpinned AS (
+        UPDATE archon_projects
+        SET pinned = false
+        WHERE $2::jsonb -> 'pinned' = 'true'::jsonb AND id != $1 AND pinned = true
+    )
+    UPDATE archon_projects SET
+        title = CASE WHEN $2::jsonb ? 'title' THEN $2::jsonb ->> 'title' ELSE title END,
+        description = CASE WHEN $2::jsonb ? 'description'
+            THEN $2::jsonb ->> 'description' ELSE description END,
+        github_repo = CASE WHEN $2::jsonb ? 'github_repo'
+            THEN $2::jsonb ->> 'github_repo' ELSE github_repo END,
+        docs = CASE WHEN $2::jsonb ? 'docs'
+            THEN COALESCE(NULLIF($2::jsonb -> 'docs', 'null'::jsonb), '[]'::jsonb) ELSE docs END,
+        features = CASE WHEN $2::jsonb ? 'features'
+            THEN COALESCE(NULLIF($2::jsonb -> 'features', 'null'::jsonb), '[]'::jsonb) ELSE features END,
+        data = CASE WHEN $2::jsonb ? 'data'
+            THEN COALESCE(NULLIF($2::jsonb -> 'data', 'null'::jsonb), '[]'::jsonb) ELSE data END,
+        pinned = CASE WHEN $2::jsonb ? 'pinned' THEN ($2::jsonb ->> 'pinned')::boolean ELSE pinned END,
+        updated_at = now()
+    WHERE id = $1
+    RETURNING {_PROJECT_COLUMNS}
+"""
+
 
 class ProjectService:
     """Service class for project operations"""
 
+    __slots__ = ("_supabase_client", "_mode", "_is_asyncpg")
+
     def __init__(self, supabase_client=None):
         """Initialize with optional supabase client (legacy mode only)"""
         self._supabase_client = supabase_client
         self._mode = get_database_mode()
+        # The database mode is fixed for the process, so resolve the branch once
+        self._is_asyncpg = self._mode == "asyncpg"
 
     @property
     def supabase_client(self):
@@ -48,24 +152,19 @@ class ProjectService:
             if not title or not isinstance(title, str) or len(title.strip()) == 0:
                 return False, {"error": "Project title is required and must be a non-empty string"}
 
-            if is_asyncpg_mode():
-                now = datetime.now()  # asyncpg needs datetime object
-                from ..database import AsyncPGClient
-
-                # Insert project
+            if self._is_asyncpg:
+                # Insert project; timestamps come from the database clock
                 project = await AsyncPGClient.fetchrow(
                     """
                     INSERT INTO archon_projects (title, github_repo, docs, features, data, created_at, updated_at)
-                    VALUES ($1, $2, $3, $4, $5, $6, $7)
-                    RETURNING *
+                    VALUES ($1, $2, $3, $4, $5, now(), now())
+                    RETURNING id, title, github_repo, created_at
                     """,
                     title.strip(),
                     github_repo.strip() if github_repo else None,
-                    json.dumps([]),  # docs
-                    json.dumps([]),  # features
-                    json.dumps([]),  # data
-                    now,
-                    now
+                    [],  # docs
+                    [],  # features
+                    [],  # data
                 )
 
                 if not project:
@@ -75,12 +174,13 @@ class ProjectService:
                 project_id = str(project["id"])
                 logger.info(f"Project created successfully with ID: {project_id}")
 
+                created_at = project["created_at"]
                 return True, {
                     "project": {
                         "id": project_id,
                         "title": project["title"],
                         "github_repo": project.get("github_repo"),
-                        "created_at": project["created_at"].isoformat() if hasattr(project["created_at"], 'isoformat') else project["created_at"],
+                        "created_at": created_at.isoformat() if isinstance(created_at, datetime) else created_at,
                     }
                 }
             else:
@@ -133,7 +233,7 @@ class ProjectService:
             Tuple of (success, result_dict)
         """
         try:
-            if is_asyncpg_mode():
+            if self._is_asyncpg:
                 return await self._list_projects_asyncpg(include_content)
             else:
                 return self._list_projects_supabase(include_content)
@@ -144,48 +244,74 @@ class ProjectService:
 
     async def _list_projects_asyncpg(self, include_content: bool) -> tuple[bool, dict[str, Any]]:
         """List projects using asyncpg."""
-        from ..database import AsyncPGClient
+        if not include_content:
+            return await self._list_project_stats_asyncpg()
+
+        # Shape the rows in SQL so each fetched dict is already the API
+        # representation; only the timestamps are converted in place
+        projects = await AsyncPGClient.fetch(
+            f"""
+            SELECT {_PROJECT_CONTENT_COLUMNS}
+            FROM archon_projects
+            ORDER BY created_at DESC
+            """
+        )
+
+        for project in projects:
+            created_at = project["created_at"]
+            if isinstance(created_at, datetime):
+                project["created_at"] = created_at.isoformat()
+            updated_at = project["updated_at"]
+            if isinstance(updated_at, datetime):
+                project["updated_at"] = updated_at.isoformat()
 
+        return True, {"projects": projects, "total_count": len(projects)}
+
+    async def _list_project_stats_asyncpg(self) -> tuple[bool, dict[str, Any]]:
+        """
+        List lightweight project metadata using asyncpg.
+
+        Counts are computed in SQL so the JSONB payloads are never transferred
+        or parsed. Arrays count their elements and objects their keys, matching
+        len() on the decoded value.
+        """
         rows = await AsyncPGClient.fetch(
-            "SELECT * FROM archon_projects ORDER BY created_at DESC"
+            """
+            SELECT id, title, github_repo, created_at, updated_at, pinned, description,
+                CASE jsonb_typeof(docs)
+                    WHEN 'array' THEN jsonb_array_length(docs)
+                    WHEN 'object' THEN (SELECT count(*) FROM jsonb_object_keys(docs))
+                    ELSE 0
+                END AS docs_count,
+                CASE jsonb_typeof(features)
+                    WHEN 'array' THEN jsonb_array_length(features)
+                    WHEN 'object' THEN (SELECT count(*) FROM jsonb_object_keys(features))
+                    ELSE 0
+                END AS features_count,
+                COALESCE(data NOT IN ('[]'::jsonb, '{}'::jsonb, 'null'::jsonb), false) AS has_data
+            FROM archon_projects
+            ORDER BY created_at DESC
+            """
         )
 
         projects = []
         for project in rows:
-            # Parse JSONB fields
-            docs = project.get("docs", [])
-            features = project.get("features", [])
-            data = project.get("data", [])
-
-            if isinstance(docs, str):
-                docs = json.loads(docs)
-            if isinstance(features, str):
-                features = json.loads(features)
-            if isinstance(data, str):
-                data = json.loads(data)
-
-            project_data = {
+            created_at = project["created_at"]
+            updated_at = project["updated_at"]
+            projects.append({
                 "id": str(project["id"]),
                 "title": project["title"],
                 "github_repo": project.get("github_repo"),
-                "created_at": project["created_at"].isoformat() if hasattr(project["created_at"], 'isoformat') else project["created_at"],
-                "updated_at": project["updated_at"].isoformat() if hasattr(project["updated_at"], 'isoformat') else project["updated_at"],
+                "created_at": created_at.isoformat() if isinstance(created_at, datetime) else created_at,
+                "updated_at": updated_at.isoformat() if isinstance(updated_at, datetime) else updated_at,
                 "pinned": project.get("pinned", False),
                 "description": project.get("description", ""),
-            }
-
-            if include_content:
-                project_data["docs"] = docs
-                project_data["features"] = features
-                project_data["data"] = data
-            else:
-                project_data["stats"] = {
-                    "docs_count": len(docs) if docs else 0,
-                    "features_count": len(features) if features else 0,
-                    "has_data": bool(data)
-                }
-
-            projects.append(project_data)
+                "stats": {
+                    "docs_count": project["docs_count"],
+                    "features_count": project["features_count"],
+                    "has_data": project["has_data"],
+                },
+            })
 
         return True, {"projects": projects, "total_count": len(projects)}
 
@@ -228,6 +354,36 @@ class ProjectService:
 
         return True, {"projects": projects, "total_count": len(projects)}
 
+    async def iter_projects_ndjson(self) -> AsyncIterator[bytes]:
+        """
+        Stream all projects with full content as newline-delimited JSON.
+
+        In asyncpg mode rows are read through a server-side cursor and encoded
+        by Postgres, so the full list is never held in memory.
+
+        Yields:
+            One JSON-encoded project per line
+        """
+        try:
+            if self._is_asyncpg:
+                async with AsyncPGClient.connection() as conn, conn.transaction():
+                    async for record in conn.cursor(
+                        f"""
+                        SELECT row_to_json(p)::text AS project
+                        FROM (SELECT {_PROJECT_CONTENT_COLUMNS} FROM archon_projects) p
+                        ORDER BY p.created_at DESC
+                        """
+                    ):
+                        yield record["project"].encode() + b"\n"
+            else:
+                _, result = self._list_projects_supabase(include_content=True)
+                for project in result["projects"]:
+                    yield orjson.dumps(project, option=orjson.OPT_APPEND_NEWLINE)
+
+        except Exception as e:
+            logger.error(f"Error streaming projects: {e}")
+            raise
+
     async def get_project(self, project_id: str) -> tuple[bool, dict[str, Any]]:
         """
         Get a specific project by ID.
@@ -236,7 +392,7 @@ class ProjectService:
             Tuple of (success, result_dict)
         """
         try:
-            if is_asyncpg_mode():
+            if self._is_asyncpg:
                 return await self._get_project_asyncpg(project_id)
             else:
                 return self._get_project_supabase(project_id)
@@ -247,78 +403,60 @@ class ProjectService:
 
     async def _get_project_asyncpg(self, project_id: str) -> tuple[bool, dict[str, Any]]:
         """Get project using asyncpg."""
-        from ..database import AsyncPGClient
-
         project = await AsyncPGClient.fetchrow(
-            "SELECT * FROM archon_projects WHERE id = $1",
-            project_id
+            f"{_PROJECT_WITH_SOURCES_SQL} WHERE p.id = $1", project_id
         )
 
         if not project:
             return False, {"error": f"Project with ID {project_id} not found"}
 
-        project_dict = dict(project)
-        project_dict["id"] = str(project_dict["id"])
+        return True, {"project": _format_project_row(project)}
 
-        # Convert datetime fields
-        if hasattr(project_dict.get("created_at"), 'isoformat'):
-            project_dict["created_at"] = project_dict["created_at"].isoformat()
-        if hasattr(project_dict.get("updated_at"), 'isoformat'):
-            project_dict["updated_at"] = project_dict["updated_at"].isoformat()
+    async def get_projects_bulk(self, project_ids: list[str]) -> tuple[bool, dict[str, Any]]:
+        """
+        Get several projects by ID, including their linked sources.
 
-        # Parse JSONB fields (asyncpg may return them as strings)
-        for field in ["docs", "features", "data"]:
-            value = project_dict.get(field)
-            if isinstance(value, str):
-                try:
-                    project_dict[field] = json.loads(value)
-                except json.JSONDecodeError:
-                    project_dict[field] = []
-            elif value is None:
-                project_dict[field] = []
-
-        # Get linked sources
-        technical_sources = []
-        business_sources = []
+        IDs are normalised to canonical UUID form and de-duplicated. Malformed
+        IDs and projects that do not exist are omitted; the rest keep the
+        requested order.
 
+        Returns:
+            Tuple of (success, result_dict)
+        """
         try:
-            sources_links = await AsyncPGClient.fetch(
-                "SELECT source_id, notes FROM archon_project_sources WHERE project_id = $1",
-                project_id
-            )
-
-            technical_source_ids = []
-            business_source_ids = []
-
-            for source_link in sources_links:
-                if source_link.get("notes") == "technical":
-                    technical_source_ids.append(str(source_link["source_id"]))
-                elif source_link.get("notes") == "business":
-                    business_source_ids.append(str(source_link["source_id"]))
-
-            if technical_source_ids:
-                placeholders = ", ".join(f"${i+1}" for i in range(len(technical_source_ids)))
-                tech_sources = await AsyncPGClient.fetch(
-                    f"SELECT * FROM archon_sources WHERE source_id IN ({placeholders})",
-                    *technical_source_ids
+            normalized_ids: dict[str, None] = {}
+            for project_id in project_ids:
+                try:
+                    normalized_ids[str(UUID(project_id))] = None
+                except (ValueError, TypeError, AttributeError):
+                    logger.debug(f"Skipping malformed project ID: {project_id!r}")
+            project_ids = list(normalized_ids)
+
+            if not project_ids:
+                projects = []
+            elif self._is_asyncpg:
+                # One query for all IDs instead of a round-trip per project
+                rows = await AsyncPGClient.fetch(
+                    f"{_PROJECT_WITH_SOURCES_SQL} WHERE p.id = ANY($1::uuid[])", project_ids
                 )
-                technical_sources = [dict(s) for s in tech_sources]
+                by_id = {str(row["id"]): row for row in rows}
+                projects = [
+                    _format_project_row(by_id[project_id])
+                    for project_id in project_ids
+                    if project_id in by_id
+                ]
+            else:
+                projects = []
+                for project_id in project_ids:
+                    success, result = self._get_project_supabase(project_id)
+                    if success:
+                        projects.append(result["project"])
 
-            if business_source_ids:
-                placeholders = ", ".join(f"${i+1}" for i in range(len(business_source_ids)))
-                biz_sources = await AsyncPGClient.fetch(
-                    f"SELECT * FROM archon_sources WHERE source_id IN ({placeholders})",
-                    *business_source_ids
-                )
-                business_sources = [dict(s) for s in biz_sources]
+            return True, {"projects": projects, "total_count": len(projects)}
 
         except Exception as e:
-            logger.warning(f"Failed to retrieve linked sources for project {project_id}: {e}")
-
-        project_dict["technical_sources"] = technical_sources
-        project_dict["business_sources"] = business_sources
-
-        return True, {"project": project_dict}
+            logger.error(f"Error getting projects: {e}")
+            return False, {"error": f"Error getting projects: {str(e)}"}
 
     def _get_project_supabase(self, project_id: str) -> tuple[bool, dict[str, Any]]:
         """Get project using Supabase (legacy)."""
@@ -389,29 +527,24 @@ class ProjectService:
             Tuple of (success, result_dict)
         """
         try:
-            if is_asyncpg_mode():
-                from ..database import AsyncPGClient
-
-                # Check if project exists
-                project = await AsyncPGClient.fetchrow(
-                    "SELECT id FROM archon_projects WHERE id = $1",
+            if self._is_asyncpg:
+                # Delete the project (tasks are deleted by cascade). The outer SELECT
+                # reads the pre-delete snapshot, so the task count is still visible.
+                result = await AsyncPGClient.fetchrow(
+                    """
+                    WITH deleted AS (
+                        DELETE FROM archon_projects WHERE id = $1 RETURNING id
+                    )
+                    SELECT
+                        (SELECT count(*) FROM deleted) AS deleted_count,
+                        (SELECT count(*) FROM archon_tasks WHERE project_id = $1) AS tasks_count
+                    """,
                     project_id
                 )
-                if not project:
+                if not result["deleted_count"]:
                     return False, {"error": f"Project with ID {project_id} not found"}
 
-                # Get task count for reporting
-                task_count_result = await AsyncPGClient.fetchval(
-                    "SELECT COUNT(*) FROM archon_tasks WHERE project_id = $1",
-                    project_id
-                )
-                tasks_count = task_count_result or 0
-
-                # Delete the project (tasks will be deleted by cascade)
-                await AsyncPGClient.execute(
-                    "DELETE FROM archon_projects WHERE id = $1",
-                    project_id
-                )
+                tasks_count = result["tasks_count"]
 
                 return True, {
                     "project_id": project_id,
@@ -450,6 +583,9 @@ class ProjectService:
         except Exception as e:
             logger.error(f"Error deleting project: {e}")
             return False, {"error": f"Error deleting project: {str(e)}"}
+        finally:
+            # The project's tasks are deleted by cascade
+            invalidate_task_caches()
 
     async def get_project_features(self, project_id: str) -> tuple[bool, dict[str, Any]]:
         """
@@ -459,9 +595,7 @@ class ProjectService:
             Tuple of (success, result_dict)
         """
         try:
-            if is_asyncpg_mode():
-                from ..database import AsyncPGClient
-
+            if self._is_asyncpg:
                 project = await AsyncPGClient.fetchrow(
                     "SELECT features FROM archon_projects WHERE id = $1",
                     project_id
@@ -471,8 +605,6 @@ class ProjectService:
                     return False, {"error": "Project not found"}
 
                 features = project.get("features", [])
-                if isinstance(features, str):
-                    features = json.loads(features)
             else:
                 response = (
                     self.supabase_client.table("archon_projects")
@@ -488,25 +620,31 @@ class ProjectService:
                 features = response.data.get("features", [])
 
             # Extract feature labels for dropdown options
-            feature_options = []
-            for feature in features:
-                if isinstance(feature, dict) and "data" in feature and "label" in feature["data"]:
-                    feature_options.append({
-                        "id": feature.get("id", ""),
-                        "label": feature["data"]["label"],
-                        "type": feature["data"].get("type", ""),
-                        "feature_type": feature.get("type", "page"),
-                    })
+            feature_options = [
+                {
+                    "id": feature.get("id", ""),
+                    "label": feature_data["label"],
+                    "type": feature_data.get("type", ""),
+                    "feature_type": feature.get("type", "page"),
+                }
+                for feature in features or []
+                if isinstance(feature, dict)
+                and isinstance(feature_data := feature.get("data"), dict)
+                and "label" in feature_data
+            ]
 
             return True, {"features": feature_options, "count": len(feature_options)}
 
-        except Exception as e:
-            error_message = str(e)
-            if "The result contains 0 rows" in error_message or "PGRST116" in error_message:
+        except APIError as e:
+            # Supabase .single() reports a missing row as PGRST116
+            if e.code == "PGRST116":
                 return False, {"error": "Project not found"}
 
             logger.error(f"Error getting project features: {e}")
             return False, {"error": f"Error getting project features: {str(e)}"}
+        except Exception as e:
+            logger.error(f"Error getting project features: {e}")
+            return False, {"error": f"Error getting project features: {str(e)}"}
 
     async def update_project(
         self, project_id: str, update_fields: dict[str, Any]
@@ -518,32 +656,18 @@ class ProjectService:
             Tuple of (success, result_dict)
         """
         try:
-            # Build update data
-            allowed_fields = [
-                "title",
-                "description",
-                "github_repo",
-                "docs",
-                "features",
-                "data",
-                "technical_sources",
-                "business_sources",
-                "pinned",
-            ]
+            # Build update data from the caller's fields that may be updated
+            update_data = {
+                field: value
+                for field, value in update_fields.items()
+                if field in _ALLOWED_UPDATE_FIELDS
+            }
 
-            if is_asyncpg_mode():
-                now = datetime.now()  # asyncpg needs datetime object
-                update_data = {"updated_at": now}
-                for field in allowed_fields:
-                    if field in update_fields:
-                        update_data[field] = update_fields[field]
-                return await self._update_project_asyncpg(project_id, update_data, update_fields)
+            if self._is_asyncpg:
+                # updated_at is set by the database in the UPDATE statement
+                return await self._update_project_asyncpg(project_id, update_data)
             else:
-                now = datetime.now().isoformat()  # Supabase needs ISO string
-                update_data = {"updated_at": now}
-                for field in allowed_fields:
-                    if field in update_fields:
-                        update_data[field] = update_fields[field]
+                update_data["updated_at"] = datetime.now().isoformat()  # Supabase needs ISO string
                 return self._update_project_supabase(project_id, update_data, update_fields)
 
         except Exception as e:
@@ -551,65 +675,15 @@ class ProjectService:
             return False, {"error": f"Error updating project: {str(e)}"}
 
     async def _update_project_asyncpg(
-        self, project_id: str, update_data: dict[str, Any], update_fields: dict[str, Any]
+        self, project_id: str, update_data: dict[str, Any]
     ) -> tuple[bool, dict[str, Any]]:
         """Update project using asyncpg."""
-        from ..database import AsyncPGClient
-
-        # Handle pinning logic - only one project can be pinned at a time
-        if update_fields.get("pinned") is True:
-            await AsyncPGClient.execute(
-                """
-                UPDATE archon_projects
-                SET pinned = false
-                WHERE id != $1 AND pinned = true
-                """,
-                project_id
-            )
-            logger.debug(f"Unpinned other projects before pinning {project_id}")
-
-        # Build SET clause dynamically
-        set_parts = []
-        params = []
-        param_idx = 1
-
-        for key, value in update_data.items():
-            # Convert lists/dicts to JSON for JSONB columns
-            if key in ["docs", "features", "data", "technical_sources", "business_sources"]:
-                value = json.dumps(value) if value is not None else json.dumps([])
-            set_parts.append(f"{key} = ${param_idx}")
-            params.append(value)
-            param_idx += 1
-
-        params.append(project_id)
-
-        query = f"""
-            UPDATE archon_projects
-            SET {", ".join(set_parts)}
-            WHERE id = ${param_idx}
-            RETURNING *
-        """
-
-        project = await AsyncPGClient.fetchrow(query, *params)
+        # One fixed statement for every update shape: the changed fields travel as a
+        # JSONB patch ($2) and columns missing from the patch keep their value
+        project = await AsyncPGClient.fetchrow(_UPDATE_PROJECT_SQL, project_id, update_data)
 
         if project:
-            project_dict = dict(project)
-            project_dict["id"] = str(project_dict["id"])
-            if hasattr(project_dict.get("created_at"), 'isoformat'):
-                project_dict["created_at"] = project_dict["created_at"].isoformat()
-            if hasattr(project_dict.get("updated_at"), 'isoformat'):
-                project_dict["updated_at"] = project_dict["updated_at"].isoformat()
-            # Parse JSONB fields (asyncpg may return them as strings)
-            for field in ["docs", "features", "data"]:
-                value = project_dict.get(field)
-                if isinstance(value, str):
-                    try:
-                        project_dict[field] = json.loads(value)
-                    except json.JSONDecodeError:
-                        project_dict[field] = []
-                elif value is None:
-                    project_dict[field] = []
-            return True, {"project": project_dict, "message": "Project updated successfully"}
+            return True, {"project": _format_project_row(project), "message": "Project updated successfully"}
         else:
             return False, {"error": f"Project with ID {project_id} not found"}
 
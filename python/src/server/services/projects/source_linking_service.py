@@ -7,13 +7,28 @@ handling both technical and business source associations.
 Supports both asyncpg (K8s) and Supabase (legacy) database backends.
 """
 
+import time
+from datetime import datetime
+from operator import itemgetter
 from typing import Any
+from uuid import UUID
+
+import asyncpg
 
 from ...config.logfire_config import get_logger
-from ..client_manager import get_database_mode, is_asyncpg_mode
+from ..client_manager import get_database_mode
 
 logger = get_logger(__name__)
 
+# Short-lived per-process cache of get_project_sources results, keyed by project ID.
+# Links change rarely compared to project views; the TTL bounds staleness across
+# workers, and local updates invalidate their entry directly.
+_SOURCES_CACHE_TTL_SECONDS = 30
+_SOURCES_CACHE_MAX_ENTRIES = 1024
+_sources_cache: dict[str, tuple[float, list[str], list[str]]] = {}
+
+_NOTES_AND_SOURCE_ID = itemgetter("notes", "source_id")
+
 
 class SourceLinkingService:
     """Service class for managing project-source relationships"""
@@ -22,6 +37,8 @@ class SourceLinkingService:
         """Initialize with optional supabase client (legacy mode only)"""
         self._supabase_client = supabase_client
         self._mode = get_database_mode()
+        # The database mode is fixed for the process, so resolve the branch once
+        self._is_asyncpg = self._mode == "asyncpg"
 
     @property
     def supabase_client(self):
@@ -40,11 +57,18 @@ class SourceLinkingService:
         Returns:
             Tuple of (success, {"technical_sources": [...], "business_sources": [...]})
         """
+        cached = _sources_cache.get(project_id)
+        if cached and time.monotonic() - cached[0] < _SOURCES_CACHE_TTL_SECONDS:
+            return True, {
+                "technical_sources": list(cached[1]),
+                "business_sources": list(cached[2]),
+            }
+
         try:
-            if is_asyncpg_mode():
-                return await self._get_project_sources_asyncpg(project_id)
+            if self._is_asyncpg:
+                success, sources = await self._get_project_sources_asyncpg(project_id)
             else:
-                return self._get_project_sources_supabase(project_id)
+                success, sources = self._get_project_sources_supabase(project_id)
         except Exception as e:
             logger.error(f"Error getting project sources: {e}")
             return False, {
@@ -53,30 +77,35 @@ class SourceLinkingService:
                 "business_sources": [],
             }
 
+        if success:
+            if len(_sources_cache) >= _SOURCES_CACHE_MAX_ENTRIES:
+                _sources_cache.clear()
+            _sources_cache[project_id] = (
+                time.monotonic(),
+                list(sources["technical_sources"]),
+                list(sources["business_sources"]),
+            )
+        return success, sources
+
     async def _get_project_sources_asyncpg(self, project_id: str) -> tuple[bool, dict[str, list[str]]]:
         """Get project sources using asyncpg."""
         from ..database import AsyncPGClient
 
-        rows = await AsyncPGClient.fetch(
+        # Bucket the links by type in SQL; the aggregate always yields one row
+        row = await AsyncPGClient.fetchrow(
             """
-            SELECT source_id, notes FROM archon_project_sources
+            SELECT
+                COALESCE(array_agg(source_id) FILTER (WHERE notes = 'technical'), '{}') AS technical_sources,
+                COALESCE(array_agg(source_id) FILTER (WHERE notes = 'business'), '{}') AS business_sources
+            FROM archon_project_sources
             WHERE project_id = $1
             """,
             project_id
         )
 
-        technical_sources = []
-        business_sources = []
-
-        for row in rows:
-            if row.get("notes") == "technical":
-                technical_sources.append(str(row["source_id"]))
-            elif row.get("notes") == "business":
-                business_sources.append(str(row["source_id"]))
-
         return True, {
-            "technical_sources": technical_sources,
-            "business_sources": business_sources,
+            "technical_sources": row["technical_sources"],
+            "business_sources": row["business_sources"],
         }
 
     def _get_project_sources_supabase(self, project_id: str) -> tuple[bool, dict[str, list[str]]]:
@@ -88,18 +117,12 @@ class SourceLinkingService:
             .execute()
         )
 
-        technical_sources = []
-        business_sources = []
-
-        for source_link in response.data:
-            if source_link.get("notes") == "technical":
-                technical_sources.append(source_link["source_id"])
-            elif source_link.get("notes") == "business":
-                business_sources.append(source_link["source_id"])
+        # Both columns are always selected, so unpack each row once
+        links = list(map(_NOTES_AND_SOURCE_ID, response.data))
 
         return True, {
-            "technical_sources": technical_sources,
-            "business_sources": business_sources,
+            "technical_sources": [source_id for notes, source_id in links if notes == "technical"],
+            "business_sources": [source_id for notes, source_id in links if notes == "business"],
         }
 
     async def update_project_sources(
@@ -114,96 +137,95 @@ class SourceLinkingService:
         Returns:
             Tuple of (success, result_dict with counts)
         """
-        result = {
-            "technical_success": 0,
-            "technical_failed": 0,
-            "business_success": 0,
-            "business_failed": 0,
-        }
-
+        # Drop the cached links before and after the write so readers never keep
+        # serving the old set from this process
+        _sources_cache.pop(project_id, None)
         try:
-            if is_asyncpg_mode():
+            if self._is_asyncpg:
                 return await self._update_project_sources_asyncpg(
-                    project_id, technical_sources, business_sources, result
+                    project_id, technical_sources, business_sources
                 )
             else:
                 return self._update_project_sources_supabase(
-                    project_id, technical_sources, business_sources, result
+                    project_id, technical_sources, business_sources
                 )
         except Exception as e:
             logger.error(f"Error updating project sources: {e}")
-            return False, {"error": str(e), **result}
+            return False, {
+                "error": str(e),
+                "technical_success": 0,
+                "technical_failed": 0,
+                "business_success": 0,
+                "business_failed": 0,
+            }
+        finally:
+            _sources_cache.pop(project_id, None)
 
     async def _update_project_sources_asyncpg(
         self, project_id: str,
         technical_sources: list[str] | None,
         business_sources: list[str] | None,
-        result: dict[str, int]
     ) -> tuple[bool, dict[str, Any]]:
         """Update project sources using asyncpg."""
         from ..database import AsyncPGClient
 
-        # Update technical sources if provided
-        if technical_sources is not None:
-            # Remove existing technical sources
-            await AsyncPGClient.execute(
-                """
-                DELETE FROM archon_project_sources
-                WHERE project_id = $1 AND notes = 'technical'
-                """,
-                project_id
-            )
-
-            # Add new technical sources
-            for source_id in technical_sources:
-                try:
-                    await AsyncPGClient.execute(
-                        """
-                        INSERT INTO archon_project_sources (project_id, source_id, notes)
-                        VALUES ($1, $2, 'technical')
-                        """,
-                        project_id, source_id
-                    )
-                    result["technical_success"] += 1
-                except Exception as e:
-                    result["technical_failed"] += 1
-                    logger.warning(f"Failed to link technical source {source_id}: {e}")
-
-        # Update business sources if provided
-        if business_sources is not None:
-            # Remove existing business sources
-            await AsyncPGClient.execute(
-                """
-                DELETE FROM archon_project_sources
-                WHERE project_id = $1 AND notes = 'business'
-                """,
-                project_id
-            )
-
-            # Add new business sources
-            for source_id in business_sources:
-                try:
-                    await AsyncPGClient.execute(
+        # Link types to replace, skipping those that were not provided
+        links = [
+            (notes, source_ids)
+            for notes, source_ids in (("technical", technical_sources), ("business", business_sources))
+            if source_ids is not None
+        ]
+        technical_count = len(technical_sources or [])
+        business_count = len(business_sources or [])
+
+        # Replace all provided link types in one transaction so a failure never
+        # leaves the project with a partially updated set of sources. Only the
+        # difference is written: links missing from the new set are deleted and
+        # new ones inserted, while unchanged links are left alone. A source can
+        # be linked once per project, so linking it under another type moves it.
+        try:
+            async with AsyncPGClient.transaction() as conn:
+                for notes, source_ids in links:
+                    await conn.execute(
                         """
+                        WITH removed AS (
+                            DELETE FROM archon_project_sources
+                            WHERE project_id = $1 AND notes = $2 AND source_id <> ALL($3::text[])
+                        )
                         INSERT INTO archon_project_sources (project_id, source_id, notes)
-                        VALUES ($1, $2, 'business')
+                        SELECT DISTINCT $1::uuid, unnest($3::text[]), $2
+                        ON CONFLICT (project_id, source_id) DO UPDATE
+                        SET notes = EXCLUDED.notes
+                        WHERE archon_project_sources.notes IS DISTINCT FROM EXCLUDED.notes
                         """,
-                        project_id, source_id
+                        project_id, notes, source_ids
                     )
-                    result["business_success"] += 1
-                except Exception as e:
-                    result["business_failed"] += 1
-                    logger.warning(f"Failed to link business source {source_id}: {e}")
+        except asyncpg.PostgresError as e:
+            logger.warning(f"Failed to update sources for project {project_id}: {e}")
+            return False, {
+                "error": str(e),
+                "technical_success": 0,
+                "technical_failed": technical_count,
+                "business_success": 0,
+                "business_failed": business_count,
+            }
 
-        return True, result
+        return True, {
+            "technical_success": technical_count,
+            "technical_failed": 0,
+            "business_success": business_count,
+            "business_failed": 0,
+        }
 
     def _update_project_sources_supabase(
         self, project_id: str,
         technical_sources: list[str] | None,
         business_sources: list[str] | None,
-        result: dict[str, int]
     ) -> tuple[bool, dict[str, Any]]:
         """Update project sources using Supabase (legacy)."""
+        technical_success = technical_failed = 0
+        business_success = business_failed = 0
+
         # Update technical sources if provided
         if technical_sources is not None:
             # Remove existing technical sources
@@ -219,9 +241,9 @@ class SourceLinkingService:
                         "source_id": source_id,
                         "notes": "technical",
                     }).execute()
-                    result["technical_success"] += 1
+                    technical_success += 1
                 except Exception as e:
-                    result["technical_failed"] += 1
+                    technical_failed += 1
                     logger.warning(f"Failed to link technical source {source_id}: {e}")
 
         # Update business sources if provided
@@ -239,12 +261,77 @@ class SourceLinkingService:
                         "source_id": source_id,
                         "notes": "business",
                     }).execute()
-                    result["business_success"] += 1
+                    business_success += 1
                 except Exception as e:
-                    result["business_failed"] += 1
+                    business_failed += 1
                     logger.warning(f"Failed to link business source {source_id}: {e}")
 
-        return True, result
+        return True, {
+            "technical_success": technical_success,
+            "technical_failed": technical_failed,
+            "business_success": business_success,
+            "business_failed": business_failed,
+        }
+
+    async def get_sources_for_projects(
+        self, project_ids: list[str]
+    ) -> dict[str, dict[str, list[str]]]:
+        """
+        Get linked sources for several projects with a single query.
+
+        Returns:
+            Mapping of project ID to {"technical_sources": [...], "business_sources": [...]}
+        """
+        sources = {
+            project_id: {"technical_sources": [], "business_sources": []}
+            for project_id in project_ids
+        }
+
+        # Rows come back under the canonical UUID text, which the caller's IDs
+        # need not match, so map each canonical ID to the keys it was given as
+        keys_by_id: dict[str, list[str]] = {}
+        for project_id in sources:
+            try:
+                keys_by_id.setdefault(str(UUID(project_id)), []).append(project_id)
+            except (ValueError, TypeError, AttributeError):
+                logger.debug(f"Skipping malformed project ID: {project_id!r}")
+        if not keys_by_id:
+            return sources
+
+        if self._is_asyncpg:
+            rows = await self._get_sources_for_projects_asyncpg(list(keys_by_id))
+        else:
+            rows = self._get_sources_for_projects_supabase(list(keys_by_id))
+
+        for row in rows:
+            notes = row.get("notes")
+            if notes in ("technical", "business"):
+                for project_id in keys_by_id.get(row["project_id"], ()):
+                    sources[project_id][f"{notes}_sources"].append(row["source_id"])
+
+        return sources
+
+    async def _get_sources_for_projects_asyncpg(self, project_ids: list[str]) -> list[dict[str, Any]]:
+        """Get source links for several projects using asyncpg."""
+        from ..database import AsyncPGClient
+
+        return await AsyncPGClient.fetch(
+            """
+            SELECT project_id::text AS project_id, source_id, notes FROM archon_project_sources
+            WHERE project_id = ANY($1::uuid[])
+            """,
+            project_ids
+        )
+
+    def _get_sources_for_projects_supabase(self, project_ids: list[str]) -> list[dict[str, Any]]:
+        """Get source links for several projects using Supabase (legacy)."""
+        response = (
+            self.supabase_client.table("archon_project_sources")
+            .select("project_id, source_id, notes")
+            .in_("project_id", project_ids)
+            .execute()
+        )
+        return response.data
 
     async def format_project_with_sources(self, project: dict[str, Any]) -> dict[str, Any]:
         """
@@ -260,12 +347,39 @@ class SourceLinkingService:
             logger.warning(f"Failed to get sources for project {project['id']}")
             sources = {"technical_sources": [], "business_sources": []}
 
+        return self._format_project(project, sources)
+
+    async def format_projects_with_sources(self, projects: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Format a list of projects with their linked sources.
+
+        Sources for all projects are fetched in one query rather than one per project.
+
+        Returns:
+            List of formatted project dicts
+        """
+        project_ids = [str(project["id"]) for project in projects]
+        try:
+            sources_by_project = await self.get_sources_for_projects(project_ids)
+        except Exception as e:
+            logger.warning(f"Failed to get sources for projects: {e}")
+            sources_by_project = {}
+
+        empty_sources = {"technical_sources": [], "business_sources": []}
+        return [
+            self._format_project(project, sources_by_project.get(project_id, empty_sources))
+            for project, project_id in zip(projects, project_ids, strict=True)
+        ]
+
+    @staticmethod
+    def _format_project(project: dict[str, Any], sources: dict[str, list[str]]) -> dict[str, Any]:
+        """Build the API representation of a project with the given linked sources."""
         # Ensure datetime objects are converted to strings
         created_at = project.get("created_at", "")
         updated_at = project.get("updated_at", "")
-        if hasattr(created_at, "isoformat"):
+        if isinstance(created_at, datetime):
             created_at = created_at.isoformat()
-        if hasattr(updated_at, "isoformat"):
+        if isinstance(updated_at, datetime):
             updated_at = updated_at.isoformat()
 
         return {
@@ -282,15 +396,3 @@ class SourceLinkingService:
             "business_sources": sources["business_sources"],
             "pinned": project.get("pinned", False),
         }
-
-    async def format_projects_with_sources(self, projects: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        """
-        Format a list of projects with their linked sources.
-
-        Returns:
-            List of formatted project dicts
-        """
-        formatted_projects = []
-        for project in projects:
-            formatted_projects.append(await self.format_project_with_sources(project))
-        return formatted_projects
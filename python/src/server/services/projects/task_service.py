@@ -7,8 +7,11 @@ shared between MCP tools and FastAPI endpoints.
 Supports both asyncpg (K8s) and Supabase (legacy) database backends.
 """
 
-import json
+import asyncio
+import copy
+import time
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 from ...config.logfire_config import get_logger
@@ -16,11 +19,137 @@ from ..client_manager import get_database_mode, is_asyncpg_mode
 
 logger = get_logger(__name__)
 
+# Task details and counts are read by polling UIs far more often than tasks change;
+# the short TTLs bound staleness across workers, and local writes invalidate directly.
+_TASK_CACHE_TTL_SECONDS = 2
+_TASK_CACHE_MAX_ENTRIES = 1024
+_task_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+_COUNTS_CACHE_TTL_SECONDS = 5
+_COUNTS_CACHE_KEY = "all"
+_counts_cache: dict[str, tuple[float, dict[str, dict[str, int]]]] = {}
+
+VALID_STATUSES: frozenset[str] = frozenset(("todo", "doing", "review", "done"))
+VALID_PRIORITIES: frozenset[str] = frozenset(("low", "medium", "high", "critical"))
+
+# Listed in workflow order for error messages (frozensets have no stable order)
+_STATUS_CHOICES = "todo, doing, review, done"
+_PRIORITY_CHOICES = "low, medium, high, critical"
+
+# Columns returned by list_tasks; the large JSONB fields are added separately
+_TASK_LIST_COLUMNS = (
+    "id::text AS id, project_id::text AS project_id, title, description, status, "
+    "assignee, task_order, priority, feature, created_at, updated_at, archived"
+)
+
+# Searchable task text; must match the expression of idx_archon_tasks_search_trgm
+_TASK_SEARCH_TEXT = (
+    "(coalesce(title, '') || ' ' || coalesce(description, '') || ' ' || coalesce(feature, ''))"
+)
+
+# Every column of a single task, as returned by get_task and update_task
+_TASK_COLUMNS = (
+    f"{_TASK_LIST_COLUMNS}, parent_task_id::text AS parent_task_id, "
+    "archived_at, archived_by, sources, code_examples"
+)
+
+# Sizes of the large JSONB fields, computed in SQL when the fields are excluded
+_TASK_STATS_COLUMNS = """
+    CASE jsonb_typeof(sources)
+        WHEN 'array' THEN jsonb_array_length(sources)
+        WHEN 'object' THEN (SELECT count(*) FROM jsonb_object_keys(sources))
+        ELSE 0
+    END AS sources_count,
+    CASE jsonb_typeof(code_examples)
+        WHEN 'array' THEN jsonb_array_length(code_examples)
+        WHEN 'object' THEN (SELECT count(*) FROM jsonb_object_keys(code_examples))
+        ELSE 0
+    END AS code_examples_count
+"""
+
+
+def invalidate_task_caches(task_id: str | None = None) -> None:
+    """Drop cached counts and the given task, or every cached task if none is given."""
+    if task_id is None:
+        _task_cache.clear()
+    else:
+        _task_cache.pop(task_id, None)
+    _counts_cache.clear()
+
+
+def _quote_postgrest_value(value: str) -> str:
+    """Double-quote a value for a PostgREST filter, escaping quotes and backslashes."""
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+@lru_cache(maxsize=64)
+def _build_list_tasks_sql(
+    has_project: bool, has_status: bool, include_closed: bool,
+    include_archived: bool, has_search: bool, exclude_large_fields: bool,
+) -> str:
+    """Build the list_tasks query for one combination of filters.
+
+    Placeholders are numbered in the order project_id, status, search pattern,
+    counting only the filters that are present.
+    """
+    conditions = []
+    param_idx = 1
+
+    if has_project:
+        conditions.append(f"project_id = ${param_idx}")
+        param_idx += 1
+
+    if has_status:
+        conditions.append(f"status = ${param_idx}")
+        param_idx += 1
+    elif not include_closed:
+        conditions.append("status != 'done'")
+
+    if not include_archived:
+        conditions.append("(archived IS NULL OR archived = false)")
+
+    if has_search:
+        # Served by the idx_archon_tasks_search_trgm GIN index
+        conditions.append(f"{_TASK_SEARCH_TEXT} ILIKE ${param_idx}")
+
+    where_clause = " AND ".join(conditions) if conditions else "1=1"
+    large_columns = _TASK_STATS_COLUMNS if exclude_large_fields else "sources, code_examples"
+    return f"""
+        SELECT {_TASK_LIST_COLUMNS}, {large_columns}
+        FROM archon_tasks
+        WHERE {where_clause}
+        ORDER BY task_order ASC, created_at ASC
+    """
+
+
+def _format_task_row(task: dict[str, Any], exclude_large_fields: bool) -> dict[str, Any]:
+    """Convert a fetched task row in place into its API representation."""
+    created_at = task["created_at"]
+    if isinstance(created_at, datetime):
+        task["created_at"] = created_at.isoformat()
+    updated_at = task["updated_at"]
+    if isinstance(updated_at, datetime):
+        task["updated_at"] = updated_at.isoformat()
+
+    if exclude_large_fields:
+        task["stats"] = {
+            "sources_count": task.pop("sources_count"),
+            "code_examples_count": task.pop("code_examples_count"),
+        }
+    else:
+        # JSONB fields arrive already decoded; only NULLs need defaults
+        if task["sources"] is None:
+            task["sources"] = []
+        if task["code_examples"] is None:
+            task["code_examples"] = []
+
+    return task
+
 
 class TaskService:
     """Service class for task operations"""
 
-    VALID_STATUSES = ["todo", "doing", "review", "done"]
+    VALID_STATUSES = VALID_STATUSES
 
     def __init__(self, supabase_client=None):
         """Initialize with optional supabase client (legacy mode only)"""
@@ -39,12 +168,9 @@ class TaskService:
 
     def validate_status(self, status: str) -> tuple[bool, str]:
         """Validate task status"""
-        if status not in self.VALID_STATUSES:
-            return (
-                False,
-                f"Invalid status '{status}'. Must be one of: {', '.join(self.VALID_STATUSES)}",
-            )
-        return True, ""
+        if status in VALID_STATUSES:
+            return True, ""
+        return False, f"Invalid status '{status}'. Must be one of: {_STATUS_CHOICES}"
 
     def validate_assignee(self, assignee: str) -> tuple[bool, str]:
         """Validate task assignee"""
@@ -54,13 +180,9 @@ class TaskService:
 
     def validate_priority(self, priority: str) -> tuple[bool, str]:
         """Validate task priority against allowed enum values"""
-        VALID_PRIORITIES = ["low", "medium", "high", "critical"]
-        if priority not in VALID_PRIORITIES:
-            return (
-                False,
-                f"Invalid priority '{priority}'. Must be one of: {', '.join(VALID_PRIORITIES)}",
-            )
-        return True, ""
+        if priority in VALID_PRIORITIES:
+            return True, ""
+        return False, f"Invalid priority '{priority}'. Must be one of: {_PRIORITY_CHOICES}"
 
     async def create_task(
         self,
@@ -114,6 +236,9 @@ class TaskService:
         except Exception as e:
             logger.error(f"Error creating task: {e}")
             return False, {"error": f"Error creating task: {str(e)}"}
+        finally:
+            # Inserting at a position also reorders other tasks in the project
+            invalidate_task_caches()
 
     async def _create_task_asyncpg(
         self, project_id: str, title: str, description: str, assignee: str,
@@ -123,60 +248,49 @@ class TaskService:
         """Create task using asyncpg."""
         from ..database import AsyncPGClient
 
-        now = datetime.now()  # asyncpg needs datetime object
+        # Shift and insert atomically. The per-project advisory lock serializes
+        # concurrent inserts into the same project so they cannot interleave and
+        # produce duplicate or skipped task_order values.
+        async with AsyncPGClient.transaction() as conn:
+            await conn.execute("SELECT pg_advisory_xact_lock(hashtext($1))", project_id)
+
+            # REORDERING LOGIC: If inserting at a specific position, shift the tasks
+            # at or after it down by one in a single statement
+            if task_order > 0:
+                # A shift can touch every task in a long column; JIT compiling
+                # that UPDATE costs more than it saves (scoped to this transaction)
+                await conn.execute("SET LOCAL jit = off")
+                status = await conn.execute(
+                    """
+                    UPDATE archon_tasks
+                    SET task_order = task_order + 1, updated_at = now()
+                    WHERE project_id = $1 AND status = $2 AND task_order >= $3
+                    """,
+                    project_id, task_status, task_order
+                )
+                shifted = int(status.split()[-1])
+                if shifted:
+                    logger.info(f"Reordering {shifted} existing tasks")
 
-        # REORDERING LOGIC: If inserting at a specific position, increment existing tasks
-        if task_order > 0:
-            existing_tasks = await AsyncPGClient.fetch(
+            # Insert the new task
+            task = await conn.fetchrow(
                 """
-                SELECT id, task_order FROM archon_tasks
-                WHERE project_id = $1 AND status = $2 AND task_order >= $3
+                INSERT INTO archon_tasks (
+                    project_id, title, description, status, assignee,
+                    task_order, priority, feature, sources, code_examples
+                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
+                RETURNING id::text AS id, project_id::text AS project_id, title, description,
+                          status, assignee, task_order, priority, created_at
                 """,
-                project_id, task_status, task_order
+                project_id, title, description, task_status, assignee,
+                task_order, priority, feature,
+                sources or [], code_examples or []
             )
 
-            if existing_tasks:
-                logger.info(f"Reordering {len(existing_tasks)} existing tasks")
-                for existing_task in existing_tasks:
-                    await AsyncPGClient.execute(
-                        """
-                        UPDATE archon_tasks
-                        SET task_order = $1, updated_at = $2
-                        WHERE id = $3
-                        """,
-                        existing_task["task_order"] + 1, now, existing_task["id"]
-                    )
-
-        # Insert the new task
-        task = await AsyncPGClient.fetchrow(
-            """
-            INSERT INTO archon_tasks (
-                project_id, title, description, status, assignee,
-                task_order, priority, feature, sources, code_examples,
-                created_at, updated_at
-            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)
-            RETURNING *
-            """,
-            project_id, title, description, task_status, assignee,
-            task_order, priority, feature,
-            json.dumps(sources or []), json.dumps(code_examples or []),
-            now, now
-        )
-
         if task:
-            return True, {
-                "task": {
-                    "id": str(task["id"]),
-                    "project_id": str(task["project_id"]),
-                    "title": task["title"],
-                    "description": task["description"],
-                    "status": task["status"],
-                    "assignee": task["assignee"],
-                    "task_order": task["task_order"],
-                    "priority": task["priority"],
-                    "created_at": task["created_at"].isoformat() if hasattr(task["created_at"], 'isoformat') else task["created_at"],
-                }
-            }
+            task = dict(task)
+            task["created_at"] = task["created_at"].isoformat()
+            return True, {"task": task}
         else:
             return False, {"error": "Failed to create task"}
 
@@ -297,78 +411,23 @@ class TaskService:
         """List tasks using asyncpg."""
         from ..database import AsyncPGClient
 
-        # Build query dynamically
-        conditions = []
+        # Parameters are bound in the same order _build_list_tasks_sql numbers them
         params = []
-        param_idx = 1
-
         if project_id:
-            conditions.append(f"project_id = ${param_idx}")
             params.append(project_id)
-            param_idx += 1
-
         if status:
-            conditions.append(f"status = ${param_idx}")
             params.append(status)
-            param_idx += 1
-        elif not include_closed:
-            conditions.append("status != 'done'")
-
-        if not include_archived:
-            conditions.append("(archived IS NULL OR archived = false)")
-
         if search_query:
-            search_pattern = f"%{search_query.lower()}%"
-            conditions.append(f"(LOWER(title) LIKE ${param_idx} OR LOWER(description) LIKE ${param_idx} OR LOWER(feature) LIKE ${param_idx})")
-            params.append(search_pattern)
-            param_idx += 1
+            params.append(f"%{search_query}%")
 
-        where_clause = " AND ".join(conditions) if conditions else "1=1"
-        query = f"""
-            SELECT * FROM archon_tasks
-            WHERE {where_clause}
-            ORDER BY task_order ASC, created_at ASC
-        """
-
-        rows = await AsyncPGClient.fetch(query, *params)
-
-        tasks = []
-        for task in rows:
-            task_data = {
-                "id": str(task["id"]),
-                "project_id": str(task["project_id"]),
-                "title": task["title"],
-                "description": task["description"],
-                "status": task["status"],
-                "assignee": task.get("assignee", "User"),
-                "task_order": task.get("task_order", 0),
-                "priority": task.get("priority", "medium"),
-                "feature": task.get("feature"),
-                "created_at": task["created_at"].isoformat() if hasattr(task["created_at"], 'isoformat') else task["created_at"],
-                "updated_at": task["updated_at"].isoformat() if hasattr(task["updated_at"], 'isoformat') else task["updated_at"],
-                "archived": task.get("archived", False),
-            }
-
-            # Handle JSONB fields
-            sources = task.get("sources", [])
-            code_examples = task.get("code_examples", [])
-
-            # Parse if string (asyncpg returns JSONB as Python objects, but just in case)
-            if isinstance(sources, str):
-                sources = json.loads(sources)
-            if isinstance(code_examples, str):
-                code_examples = json.loads(code_examples)
-
-            if not exclude_large_fields:
-                task_data["sources"] = sources
-                task_data["code_examples"] = code_examples
-            else:
-                task_data["stats"] = {
-                    "sources_count": len(sources) if sources else 0,
-                    "code_examples_count": len(code_examples) if code_examples else 0
-                }
+        query = _build_list_tasks_sql(
+            bool(project_id), bool(status), include_closed,
+            include_archived, bool(search_query), exclude_large_fields,
+        )
 
-            tasks.append(task_data)
+        tasks = await AsyncPGClient.fetch(query, *params)
+        for task in tasks:
+            _format_task_row(task, exclude_large_fields)
 
         filter_info = []
         if project_id:
@@ -418,21 +477,12 @@ class TaskService:
 
         # Apply keyword search if provided
         if search_query:
-            search_terms = search_query.lower().split()
-            if len(search_terms) == 1:
-                term = search_terms[0]
-                query = query.or_(
-                    f"title.ilike.%{term}%,"
-                    f"description.ilike.%{term}%,"
-                    f"feature.ilike.%{term}%"
-                )
-            else:
-                full_query = search_query.lower()
-                query = query.or_(
-                    f"title.ilike.%{full_query}%,"
-                    f"description.ilike.%{full_query}%,"
-                    f"feature.ilike.%{full_query}%"
-                )
+            # ilike is already case-insensitive; quoting keeps commas and
+            # parentheses in the term from being read as filter syntax
+            pattern = _quote_postgrest_value(f"%{search_query.strip()}%")
+            query = query.or_(
+                f"title.ilike.{pattern},description.ilike.{pattern},feature.ilike.{pattern}"
+            )
             filters_applied.append(f"search={search_query}")
 
         # Filter out archived tasks only if not including them
@@ -496,35 +546,32 @@ class TaskService:
         Returns:
             Tuple of (success, result_dict)
         """
+        cached = _task_cache.get(task_id)
+        if cached and time.monotonic() - cached[0] < _TASK_CACHE_TTL_SECONDS:
+            return True, {"task": copy.deepcopy(cached[1])}
+
         try:
             if is_asyncpg_mode():
                 from ..database import AsyncPGClient
                 task = await AsyncPGClient.fetchrow(
-                    "SELECT * FROM archon_tasks WHERE id = $1",
+                    f"SELECT {_TASK_COLUMNS} FROM archon_tasks WHERE id = $1",
                     task_id
                 )
-                if task:
-                    task_dict = dict(task)
-                    # Convert UUID to string
-                    task_dict["id"] = str(task_dict["id"])
-                    task_dict["project_id"] = str(task_dict["project_id"])
-                    # Convert datetime to ISO string
-                    if hasattr(task_dict.get("created_at"), 'isoformat'):
-                        task_dict["created_at"] = task_dict["created_at"].isoformat()
-                    if hasattr(task_dict.get("updated_at"), 'isoformat'):
-                        task_dict["updated_at"] = task_dict["updated_at"].isoformat()
-                    return True, {"task": task_dict}
-                else:
+                if not task:
                     return False, {"error": f"Task with ID {task_id} not found"}
+                _format_task_row(task, exclude_large_fields=False)
             else:
                 response = (
                     self.supabase_client.table("archon_tasks").select("*").eq("id", task_id).execute()
                 )
-                if response.data:
-                    task = response.data[0]
-                    return True, {"task": task}
-                else:
+                if not response.data:
                     return False, {"error": f"Task with ID {task_id} not found"}
+                task = response.data[0]
+
+            if len(_task_cache) >= _TASK_CACHE_MAX_ENTRIES:
+                _task_cache.clear()
+            _task_cache[task_id] = (time.monotonic(), copy.deepcopy(task))
+            return True, {"task": task}
 
         except Exception as e:
             logger.error(f"Error getting task: {e}")
@@ -574,8 +621,12 @@ class TaskService:
             if "feature" in update_fields:
                 update_data["feature"] = update_fields["feature"]
 
+            # Nothing to change: skip the write and return the task as it is
+            if not update_data:
+                return await self.get_task(task_id)
+
             if is_asyncpg_mode():
-                update_data["updated_at"] = datetime.now()  # asyncpg needs datetime object
+                # updated_at is set by the database
                 return await self._update_task_asyncpg(task_id, update_data)
             else:
                 update_data["updated_at"] = datetime.now().isoformat()  # Supabase needs ISO string
@@ -584,6 +635,8 @@ class TaskService:
         except Exception as e:
             logger.error(f"Error updating task: {e}")
             return False, {"error": f"Error updating task: {str(e)}"}
+        finally:
+            invalidate_task_caches(task_id)
 
     async def _update_task_asyncpg(
         self, task_id: str, update_data: dict[str, Any]
@@ -592,37 +645,32 @@ class TaskService:
         from ..database import AsyncPGClient
 
         # Build SET clause dynamically
-        set_parts = []
-        params = []
-        param_idx = 1
-
-        for key, value in update_data.items():
-            set_parts.append(f"{key} = ${param_idx}")
-            params.append(value)
-            param_idx += 1
-
-        params.append(task_id)  # For WHERE clause
+        columns = list(update_data)
+        placeholders = [f"${i}" for i in range(1, len(columns) + 1)]
+        params = [*update_data.values(), task_id]
 
+        # Rows whose values already match are left alone, so an unchanged
+        # update writes nothing and keeps its updated_at
         query = f"""
             UPDATE archon_tasks
-            SET {", ".join(set_parts)}
-            WHERE id = ${param_idx}
-            RETURNING *
+            SET {", ".join(f"{c} = {p}" for c, p in zip(columns, placeholders, strict=True))},
+                updated_at = now()
+            WHERE id = ${len(params)}
+              AND ({", ".join(columns)}) IS DISTINCT FROM ({", ".join(placeholders)})
+            RETURNING {_TASK_COLUMNS}
         """
 
         task = await AsyncPGClient.fetchrow(query, *params)
 
         if task:
-            task_dict = dict(task)
-            task_dict["id"] = str(task_dict["id"])
-            task_dict["project_id"] = str(task_dict["project_id"])
-            if hasattr(task_dict.get("created_at"), 'isoformat'):
-                task_dict["created_at"] = task_dict["created_at"].isoformat()
-            if hasattr(task_dict.get("updated_at"), 'isoformat'):
-                task_dict["updated_at"] = task_dict["updated_at"].isoformat()
-            return True, {"task": task_dict, "message": "Task updated successfully"}
-        else:
-            return False, {"error": f"Task with ID {task_id} not found"}
+            _format_task_row(task, exclude_large_fields=False)
+            return True, {"task": task, "message": "Task updated successfully"}
+
+        # Either the task is missing or nothing changed
+        success, result = await self.get_task(task_id)
+        if success:
+            result["message"] = "Task updated successfully"
+        return success, result
 
     async def _update_task_supabase(
         self, task_id: str, update_data: dict[str, Any]
@@ -654,44 +702,30 @@ class TaskService:
             if is_asyncpg_mode():
                 from ..database import AsyncPGClient
 
-                now = datetime.now()  # asyncpg needs datetime object
-
-                # Check if task exists and is not already archived
-                task = await AsyncPGClient.fetchrow(
-                    "SELECT * FROM archon_tasks WHERE id = $1",
-                    task_id
-                )
-                if not task:
-                    return False, {"error": f"Task with ID {task_id} not found"}
-
-                if task.get("archived") is True:
-                    return False, {"error": f"Task with ID {task_id} is already archived"}
-
-                # Archive the task
-                await AsyncPGClient.execute(
+                # Archive only if not archived yet, and report in the same round-trip
+                # whether the task exists so both failures can be told apart
+                result = await AsyncPGClient.fetchrow(
                     """
-                    UPDATE archon_tasks
-                    SET archived = true, archived_at = $1, archived_by = $2, updated_at = $3
-                    WHERE id = $4
+                    WITH archived AS (
+                        UPDATE archon_tasks
+                        SET archived = true, archived_at = now(), archived_by = $1, updated_at = now()
+                        WHERE id = $2 AND (archived IS NULL OR archived = false)
+                        RETURNING id
+                    )
+                    SELECT EXISTS (SELECT 1 FROM archived) AS archived,
+                           EXISTS (SELECT 1 FROM archon_tasks WHERE id = $2) AS found
                     """,
-                    now, archived_by, now, task_id
+                    archived_by, task_id
                 )
-                return True, {"task_id": task_id, "message": "Task archived successfully"}
+                if result["archived"]:
+                    return True, {"task_id": task_id, "message": "Task archived successfully"}
+                if not result["found"]:
+                    return False, {"error": f"Task with ID {task_id} not found"}
+                return False, {"error": f"Task with ID {task_id} is already archived"}
             else:
                 now = datetime.now().isoformat()  # Supabase needs ISO string
 
-                # Check if task exists and is not already archived
-                task_response = (
-                    self.supabase_client.table("archon_tasks").select("*").eq("id", task_id).execute()
-                )
-                if not task_response.data:
-                    return False, {"error": f"Task with ID {task_id} not found"}
-
-                task = task_response.data[0]
-                if task.get("archived") is True:
-                    return False, {"error": f"Task with ID {task_id} is already archived"}
-
-                # Archive the task
+                # Archive only if not archived yet; the common path is one round-trip
                 archive_data = {
                     "archived": True,
                     "archived_at": now,
@@ -703,17 +737,25 @@ class TaskService:
                     self.supabase_client.table("archon_tasks")
                     .update(archive_data)
                     .eq("id", task_id)
+                    .or_("archived.is.null,archived.is.false")
                     .execute()
                 )
-
                 if response.data:
                     return True, {"task_id": task_id, "message": "Task archived successfully"}
-                else:
-                    return False, {"error": f"Failed to archive task {task_id}"}
+
+                # Nothing was updated: tell a missing task from an archived one
+                task_response = (
+                    self.supabase_client.table("archon_tasks").select("id").eq("id", task_id).execute()
+                )
+                if not task_response.data:
+                    return False, {"error": f"Task with ID {task_id} not found"}
+                return False, {"error": f"Task with ID {task_id} is already archived"}
 
         except Exception as e:
             logger.error(f"Error archiving task: {e}")
             return False, {"error": f"Error archiving task: {str(e)}"}
+        finally:
+            invalidate_task_caches(task_id)
 
     async def get_all_project_task_counts(self) -> tuple[bool, dict[str, dict[str, int]]]:
         """
@@ -726,16 +768,23 @@ class TaskService:
             Tuple of (success, counts_dict) where counts_dict is:
             {"project-id": {"todo": 5, "doing": 2, "done": 10}}
         """
+        cached = _counts_cache.get(_COUNTS_CACHE_KEY)
+        if cached and time.monotonic() - cached[0] < _COUNTS_CACHE_TTL_SECONDS:
+            return True, {project_id: dict(counts) for project_id, counts in cached[1].items()}
+
         try:
             logger.debug("Fetching task counts for all projects in batch")
 
             if is_asyncpg_mode():
                 from ..database import AsyncPGClient
 
+                # Aggregate in the database: one row per project and status
                 rows = await AsyncPGClient.fetch(
                     """
-                    SELECT project_id, status FROM archon_tasks
+                    SELECT project_id::text AS project_id, status, count(*) AS task_count
+                    FROM archon_tasks
                     WHERE archived IS NULL OR archived = false
+                    GROUP BY project_id, status
                     """
                 )
             else:
@@ -749,9 +798,9 @@ class TaskService:
 
             if not rows:
                 logger.debug("No tasks found")
-                return True, {}
 
-            # Process results into counts by project and status
+            # Process results into counts by project and status. Grouped asyncpg rows
+            # carry their count; Supabase returns one row per task.
             counts_by_project = {}
 
             for task in rows:
@@ -770,7 +819,7 @@ class TaskService:
                     }
 
                 if status in ["todo", "doing", "review", "done"]:
-                    counts_by_project[project_id][status] += 1
+                    counts_by_project[project_id][status] += task.get("task_count", 1)
 
             # Merge "review" into "doing" for frontend compatibility
             # Frontend expects 3 statuses: todo, doing, done
@@ -780,8 +829,41 @@ class TaskService:
 
             logger.debug(f"Task counts fetched for {len(counts_by_project)} projects")
 
+            _counts_cache[_COUNTS_CACHE_KEY] = (
+                time.monotonic(),
+                {project_id: dict(counts) for project_id, counts in counts_by_project.items()},
+            )
             return True, counts_by_project
 
         except Exception as e:
             logger.error(f"Error fetching task counts: {e}")
             return False, {"error": f"Error fetching task counts: {str(e)}"}
+
+    async def get_project_dashboard(self, project_id: str) -> tuple[bool, dict[str, Any]]:
+        """
+        Get a project's task list and status counts in one call.
+
+        The two queries are independent, so they run concurrently on separate
+        pooled connections instead of one after the other.
+
+        Returns:
+            Tuple of (success, {"tasks": [...], "counts": {"todo": n, "doing": n, "done": n}})
+        """
+        (tasks_ok, tasks_result), (counts_ok, counts_result) = await asyncio.gather(
+            self.list_tasks(
+                project_id=project_id,
+                include_closed=True,
+                exclude_large_fields=True,
+            ),
+            self.get_all_project_task_counts(),
+        )
+
+        if not tasks_ok:
+            return False, tasks_result
+        if not counts_ok:
+            return False, counts_result
+
+        return True, {
+            "tasks": tasks_result["tasks"],
+            "counts": counts_result.get(project_id, {"todo": 0, "doing": 0, "done": 0}),
+        }
@@ -7,15 +7,36 @@ that can be shared between MCP tools and FastAPI endpoints.
 Supports both asyncpg (K8s) and Supabase (legacy) database backends.
 """
 
-import json
-from datetime import datetime
 from typing import Any
 
+import asyncpg
+import orjson
+
 from ...config.logfire_config import get_logger
 from ..client_manager import get_database_mode, is_asyncpg_mode
 
 logger = get_logger(__name__)
 
+# Project JSONB columns that can be versioned and restored
+VERSIONED_FIELDS: frozenset[str] = frozenset(("docs", "features", "data"))
+
+# Metadata columns of a version row, with UUIDs and the timestamp already formatted
+# as text; the content snapshot is left out
+_VERSION_COLUMNS = (
+    "id::text AS id, project_id::text AS project_id, task_id::text AS task_id, field_name, "
+    "version_number, change_summary, change_type, document_id, created_by, "
+    "to_char(created_at AT TIME ZONE 'UTC', 'YYYY-MM-DD\"T\"HH24:MI:SS.US\"+00:00\"') AS created_at"
+)
+
+# Same metadata columns for PostgREST selects
+_VERSION_SELECT = (
+    "id,project_id,task_id,field_name,version_number,"
+    "change_summary,change_type,document_id,created_by,created_at"
+)
+
+# Retries when a concurrent writer takes the same version number first
+_VERSION_INSERT_ATTEMPTS = 5
+
 
 class VersioningService:
     """Service class for document versioning operations"""
@@ -75,50 +96,187 @@ class VersioningService:
         """Create version using asyncpg."""
         from ..database import AsyncPGClient
 
-        # Get current highest version number for this project/field
-        result = await AsyncPGClient.fetchrow(
-            """
-            SELECT version_number FROM archon_document_versions
-            WHERE project_id = $1 AND field_name = $2
-            ORDER BY version_number DESC
-            LIMIT 1
-            """,
-            project_id, field_name
-        )
-
-        next_version = 1
-        if result:
-            next_version = result["version_number"] + 1
-
-        now = datetime.now()  # asyncpg needs datetime object
-
-        # Create new version record
-        version = await AsyncPGClient.fetchrow(
-            """
-            INSERT INTO archon_document_versions (
-                project_id, field_name, version_number, content,
-                change_summary, change_type, document_id, created_by, created_at
-            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
-            RETURNING *
-            """,
-            project_id, field_name, next_version,
-            json.dumps(content) if isinstance(content, (dict, list)) else content,
-            change_summary or f"{change_type.capitalize()} {field_name}",
-            change_type, document_id, created_by, now
-        )
+        # Number and insert the version in one statement. A concurrent writer can
+        # still take the same number; the unique index rejects the loser, which
+        # retries with the next number.
+        for attempt in range(_VERSION_INSERT_ATTEMPTS):
+            try:
+                # The content is not sent back; the caller already has it
+                version = await AsyncPGClient.fetchrow(
+                    f"""
+                    INSERT INTO archon_document_versions (
+                        project_id, field_name, version_number, content,
+                        change_summary, change_type, document_id, created_by
+                    )
+                    SELECT $1, $2, COALESCE(MAX(version_number), 0) + 1, $3, $4, $5, $6, $7
+                    FROM archon_document_versions
+                    WHERE project_id = $1 AND field_name = $2
+                    RETURNING {_VERSION_COLUMNS}
+                    """,
+                    project_id, field_name,
+                    content,
+                    change_summary or f"{change_type.capitalize()} {field_name}",
+                    change_type, document_id, created_by
+                )
+                break
+            except asyncpg.UniqueViolationError:
+                if attempt == _VERSION_INSERT_ATTEMPTS - 1:
+                    raise
+                logger.debug(f"Version number taken concurrently for {field_name}, retrying")
 
         if version:
             version_dict = dict(version)
-            version_dict["id"] = str(version_dict.get("id", ""))
+            version_dict["content"] = content
             return True, {
                 "version": version_dict,
                 "project_id": project_id,
                 "field_name": field_name,
-                "version_number": next_version,
+                "version_number": version_dict["version_number"],
             }
         else:
             return False, {"error": "Failed to create version snapshot"}
 
+    async def create_versions_bulk(
+        self, versions: list[dict[str, Any]]
+    ) -> tuple[bool, dict[str, Any]]:
+        """
+        Create several version snapshots with a single insert, e.g. before a
+        multi-field project update.
+
+        Each dict takes the same arguments as create_version. Snapshots of the
+        same project field are numbered in list order.
+
+        Returns:
+            Tuple of (success, {"versions": [...], "count": n})
+        """
+        try:
+            rows = [
+                (
+                    version["project_id"],
+                    version["field_name"],
+                    version["content"],
+                    version.get("change_summary")
+                    or f"{version.get('change_type', 'update').capitalize()} {version['field_name']}",
+                    version.get("change_type", "update"),
+                    version.get("document_id"),
+                    version.get("created_by", "system"),
+                )
+                for version in versions
+            ]
+
+            if not rows:
+                return True, {"versions": [], "count": 0}
+
+            if is_asyncpg_mode():
+                created = await self._create_versions_bulk_asyncpg(rows)
+            else:
+                created = self._create_versions_bulk_supabase(rows)
+
+            return True, {"versions": created, "count": len(created)}
+
+        except Exception as e:
+            logger.error(f"Error creating versions: {e}")
+            return False, {"error": f"Error creating versions: {str(e)}"}
+
+    async def _create_versions_bulk_asyncpg(self, rows: list[tuple]) -> list[dict[str, Any]]:
+        """Insert version rows with one INSERT ... SELECT FROM unnest() using asyncpg."""
+        from ..database import AsyncPGClient
+
+        columns = list(zip(*rows, strict=True))
+        # jsonb[] elements go in pre-serialized; asyncpg would read nested lists
+        # as extra array dimensions
+        columns[2] = [orjson.dumps(content).decode() for content in columns[2]]
+
+        # Each snapshot is numbered after the latest existing version of its field,
+        # plus its position among the new snapshots of that field. Concurrent
+        # writers are handled like in _create_version_asyncpg.
+        for attempt in range(_VERSION_INSERT_ATTEMPTS):
+            try:
+                return await AsyncPGClient.fetch(
+                    f"""
+                    WITH input AS (
+                        SELECT *, row_number() OVER (
+                            PARTITION BY project_id, field_name ORDER BY position
+                        ) AS offset_number
+                        FROM unnest(
+                            $1::uuid[], $2::text[], $3::jsonb[], $4::text[],
+                            $5::text[], $6::text[], $7::text[]
+                        ) WITH ORDINALITY AS t(
+                            project_id, field_name, content, change_summary,
+                            change_type, document_id, created_by, position
+                        )
+                    ),
+                    latest AS (
+                        SELECT project_id, field_name, MAX(version_number) AS version_number
+                        FROM archon_document_versions
+                        WHERE (project_id, field_name) IN (SELECT project_id, field_name FROM input)
+                        GROUP BY project_id, field_name
+                    ),
+                    created AS (
+                        INSERT INTO archon_document_versions (
+                            project_id, field_name, version_number, content,
+                            change_summary, change_type, document_id, created_by
+                        )
+                        SELECT input.project_id, input.field_name,
+                               COALESCE(latest.version_number, 0) + input.offset_number,
+                               input.content, input.change_summary, input.change_type,
+                               input.document_id, input.created_by
+                        FROM input
+                        LEFT JOIN latest USING (project_id, field_name)
+                        RETURNING *
+                    )
+                    SELECT {_VERSION_COLUMNS} FROM created
+                    ORDER BY project_id, field_name, version_number
+                    """,
+                    *columns
+                )
+            except asyncpg.UniqueViolationError:
+                if attempt == _VERSION_INSERT_ATTEMPTS - 1:
+                    raise
+                logger.debug("Version numbers taken concurrently, retrying bulk insert")
+
+    def _create_versions_bulk_supabase(self, rows: list[tuple]) -> list[dict[str, Any]]:
+        """Insert version rows in one request using Supabase (legacy)."""
+        project_ids = list({row[0] for row in rows})
+        field_names = list({row[1] for row in rows})
+        existing = (
+            self.supabase_client.table("archon_document_versions")
+            .select("project_id,field_name,version_number")
+            .in_("project_id", project_ids)
+            .in_("field_name", field_names)
+            .execute()
+        )
+
+        latest: dict[tuple[str, str], int] = {}
+        for version in existing.data or []:
+            key = (version["project_id"], version["field_name"])
+            latest[key] = max(latest.get(key, 0), version["version_number"])
+
+        version_data = []
+        for project_id, field_name, content, change_summary, change_type, document_id, created_by in rows:
+            key = (project_id, field_name)
+            latest[key] = latest.get(key, 0) + 1
+            version_data.append({
+                "project_id": project_id,
+                "field_name": field_name,
+                "version_number": latest[key],
+                "content": content,
+                "change_summary": change_summary,
+                "change_type": change_type,
+                "document_id": document_id,
+                "created_by": created_by,
+            })
+
+        response = (
+            self.supabase_client.table("archon_document_versions")
+            .insert(version_data)
+            .execute()
+        )
+        return [
+            {key: value for key, value in version.items() if key != "content"}
+            for version in response.data
+        ]
+
     def _create_version_supabase(
         self, project_id: str, field_name: str, content: Any,
         change_summary: str | None, change_type: str,
@@ -150,7 +308,6 @@ class VersioningService:
             "change_type": change_type,
             "document_id": document_id,
             "created_by": created_by,
-            "created_at": datetime.now().isoformat(),
         }
 
         result = (
@@ -180,68 +337,103 @@ class VersioningService:
         """
         try:
             if is_asyncpg_mode():
-                from ..database import AsyncPGClient
+                versions_by_project = await self._list_versions_asyncpg([project_id], field_name)
+            else:
+                versions_by_project = self._list_versions_supabase([project_id], field_name)
 
-                if field_name:
-                    rows = await AsyncPGClient.fetch(
-                        """
-                        SELECT * FROM archon_document_versions
-                        WHERE project_id = $1 AND field_name = $2
-                        ORDER BY version_number DESC
-                        """,
-                        project_id, field_name
-                    )
-                else:
-                    rows = await AsyncPGClient.fetch(
-                        """
-                        SELECT * FROM archon_document_versions
-                        WHERE project_id = $1
-                        ORDER BY version_number DESC
-                        """,
-                        project_id
-                    )
+            # Grouped under the database's canonical id text, which need not match
+            # how the caller spelled project_id; one project gives at most one group
+            versions = [version for group in versions_by_project.values() for version in group]
+            return True, {
+                "project_id": project_id,
+                "field_name": field_name,
+                "versions": versions,
+                "total_count": len(versions),
+            }
 
-                versions = []
-                for row in rows:
-                    version = dict(row)
-                    version["id"] = str(version.get("id", ""))
-                    if hasattr(version.get("created_at"), 'isoformat'):
-                        version["created_at"] = version["created_at"].isoformat()
-                    versions.append(version)
-
-                return True, {
-                    "project_id": project_id,
-                    "field_name": field_name,
-                    "versions": versions,
-                    "total_count": len(versions),
-                }
-            else:
-                # Build query
-                query = (
-                    self.supabase_client.table("archon_document_versions")
-                    .select("*")
-                    .eq("project_id", project_id)
-                )
+        except Exception as e:
+            logger.error(f"Error getting version history: {e}")
+            return False, {"error": f"Error getting version history: {str(e)}"}
 
-                if field_name:
-                    query = query.eq("field_name", field_name)
+    async def list_versions_bulk(
+        self, project_ids: list[str], field_name: str | None = None
+    ) -> tuple[bool, dict[str, Any]]:
+        """
+        Get version history for several projects with a single query.
 
-                result = query.order("version_number", desc=True).execute()
+        Returns:
+            Tuple of (success, {"versions": {project_id: [versions, newest first]}})
+        """
+        try:
+            if not project_ids:
+                return True, {"field_name": field_name, "versions": {}}
 
-                if result.data is not None:
-                    return True, {
-                        "project_id": project_id,
-                        "field_name": field_name,
-                        "versions": result.data,
-                        "total_count": len(result.data),
-                    }
-                else:
-                    return False, {"error": "Failed to retrieve version history"}
+            if is_asyncpg_mode():
+                versions_by_project = await self._list_versions_asyncpg(project_ids, field_name)
+            else:
+                versions_by_project = self._list_versions_supabase(project_ids, field_name)
+
+            return True, {"field_name": field_name, "versions": versions_by_project}
 
         except Exception as e:
             logger.error(f"Error getting version history: {e}")
             return False, {"error": f"Error getting version history: {str(e)}"}
 
+    async def _list_versions_asyncpg(
+        self, project_ids: list[str], field_name: str | None
+    ) -> dict[str, list[dict[str, Any]]]:
+        """List versions for the given projects using asyncpg, grouped by project."""
+        from ..database import AsyncPGClient
+
+        if field_name:
+            rows = await AsyncPGClient.fetch(
+                f"""
+                SELECT {_VERSION_COLUMNS}
+                FROM archon_document_versions
+                WHERE project_id = ANY($1::uuid[]) AND field_name = $2
+                ORDER BY version_number DESC
+                """,
+                project_ids, field_name
+            )
+        else:
+            rows = await AsyncPGClient.fetch(
+                f"""
+                SELECT {_VERSION_COLUMNS}
+                FROM archon_document_versions
+                WHERE project_id = ANY($1::uuid[])
+                ORDER BY version_number DESC
+                """,
+                project_ids
+            )
+
+        versions_by_project: dict[str, list[dict[str, Any]]] = {}
+        for version in rows:
+            versions_by_project.setdefault(version["project_id"], []).append(version)
+        return versions_by_project
+
+    def _list_versions_supabase(
+        self, project_ids: list[str], field_name: str | None
+    ) -> dict[str, list[dict[str, Any]]]:
+        """List versions for the given projects using Supabase (legacy), grouped by project."""
+        query = (
+            self.supabase_client.table("archon_document_versions")
+            .select(_VERSION_SELECT)
+            .in_("project_id", project_ids)
+        )
+
+        if field_name:
+            query = query.eq("field_name", field_name)
+
+        result = query.order("version_number", desc=True).execute()
+
+        if result.data is None:
+            raise RuntimeError("Failed to retrieve version history")
+
+        versions_by_project: dict[str, list[dict[str, Any]]] = {}
+        for version in result.data:
+            versions_by_project.setdefault(version["project_id"], []).append(version)
+        return versions_by_project
+
     async def get_version_content(
         self, project_id: str, field_name: str, version_number: int
     ) -> tuple[bool, dict[str, Any]]:
@@ -256,8 +448,8 @@ class VersioningService:
                 from ..database import AsyncPGClient
 
                 version = await AsyncPGClient.fetchrow(
-                    """
-                    SELECT * FROM archon_document_versions
+                    f"""
+                    SELECT {_VERSION_COLUMNS}, content FROM archon_document_versions
                     WHERE project_id = $1 AND field_name = $2 AND version_number = $3
                     """,
                     project_id, field_name, version_number
@@ -265,12 +457,9 @@ class VersioningService:
 
                 if version:
                     version_dict = dict(version)
-                    content = version_dict.get("content", {})
-                    if isinstance(content, str):
-                        content = json.loads(content)
                     return True, {
                         "version": version_dict,
-                        "content": content,
+                        "content": version_dict.get("content", {}),
                         "field_name": field_name,
                         "version_number": version_number,
                     }
@@ -279,7 +468,7 @@ class VersioningService:
             else:
                 result = (
                     self.supabase_client.table("archon_document_versions")
-                    .select("*")
+                    .select(f"{_VERSION_SELECT},content")
                     .eq("project_id", project_id)
                     .eq("field_name", field_name)
                     .eq("version_number", version_number)
@@ -330,72 +519,65 @@ class VersioningService:
         """Restore version using asyncpg."""
         from ..database import AsyncPGClient
 
-        # Get the version to restore
-        version_to_restore = await AsyncPGClient.fetchrow(
-            """
-            SELECT * FROM archon_document_versions
-            WHERE project_id = $1 AND field_name = $2 AND version_number = $3
+        # The field name is interpolated into the SQL, so only known columns pass
+        if field_name not in VERSIONED_FIELDS:
+            return False, {"error": f"Field {field_name} cannot be versioned"}
+
+        # Back up the current content, restore the version and record the restore
+        # in one statement. The backup and restore rows take the next two version
+        # numbers (just one if the project row is gone and no backup is written).
+        result = await AsyncPGClient.fetchrow(
+            f"""
+            WITH target AS (
+                SELECT content FROM archon_document_versions
+                WHERE project_id = $1 AND field_name = $2 AND version_number = $3
+            ),
+            current AS (
+                SELECT {field_name} AS content FROM archon_projects
+                WHERE id = $1 AND EXISTS (SELECT 1 FROM target)
+                FOR UPDATE
+            ),
+            latest AS (
+                SELECT COALESCE(MAX(version_number), 0) AS version_number
+                FROM archon_document_versions
+                WHERE project_id = $1 AND field_name = $2
+            ),
+            restored AS (
+                UPDATE archon_projects
+                SET {field_name} = (SELECT content FROM target), updated_at = now()
+                WHERE id = $1 AND EXISTS (SELECT 1 FROM target)
+                RETURNING id
+            ),
+            backup AS (
+                INSERT INTO archon_document_versions (
+                    project_id, field_name, version_number, content,
+                    change_summary, change_type, created_by
+                )
+                SELECT $1, $2, latest.version_number + 1, COALESCE(current.content, 'null'::jsonb),
+                       'Backup before restoring to version ' || $3, 'backup', $4
+                FROM current, latest
+                RETURNING version_number
+            ),
+            restore AS (
+                INSERT INTO archon_document_versions (
+                    project_id, field_name, version_number, content,
+                    change_summary, change_type, created_by
+                )
+                SELECT $1, $2, latest.version_number + (SELECT count(*) FROM current) + 1,
+                       target.content, 'Restored to version ' || $3, 'restore', $4
+                FROM target, latest
+                RETURNING version_number
+            )
+            SELECT EXISTS (SELECT 1 FROM target) AS found
             """,
-            project_id, field_name, version_number
+            project_id, field_name, version_number, restored_by
         )
 
-        if not version_to_restore:
+        if not result["found"]:
             return False, {
                 "error": f"Version {version_number} not found for {field_name} in project {project_id}"
             }
 
-        content_to_restore = version_to_restore["content"]
-        if isinstance(content_to_restore, str):
-            content_to_restore = json.loads(content_to_restore)
-
-        # Get current content to create backup
-        current_project = await AsyncPGClient.fetchrow(
-            f"SELECT {field_name} FROM archon_projects WHERE id = $1",
-            project_id
-        )
-
-        if current_project:
-            current_content = current_project.get(field_name, {})
-            if isinstance(current_content, str):
-                current_content = json.loads(current_content)
-
-            # Create backup version before restore
-            backup_result = await self.create_version(
-                project_id=project_id,
-                field_name=field_name,
-                content=current_content,
-                change_summary=f"Backup before restoring to version {version_number}",
-                change_type="backup",
-                created_by=restored_by,
-            )
-
-            if not backup_result[0]:
-                logger.warning(f"Failed to create backup version: {backup_result[1]}")
-
-        now = datetime.now()  # asyncpg needs datetime object
-
-        # Restore the content to project
-        await AsyncPGClient.execute(
-            f"""
-            UPDATE archon_projects
-            SET {field_name} = $1, updated_at = $2
-            WHERE id = $3
-            """,
-            json.dumps(content_to_restore),
-            now,
-            project_id
-        )
-
-        # Create restore version record
-        await self.create_version(
-            project_id=project_id,
-            field_name=field_name,
-            content=content_to_restore,
-            change_summary=f"Restored to version {version_number}",
-            change_type="restore",
-            created_by=restored_by,
-        )
-
         return True, {
             "project_id": project_id,
             "field_name": field_name,
@@ -410,7 +592,7 @@ class VersioningService:
         # Get the version to restore
         version_result = (
             self.supabase_client.table("archon_document_versions")
-            .select("*")
+            .select("content")
             .eq("project_id", project_id)
             .eq("field_name", field_name)
             .eq("version_number", version_number)
@@ -450,7 +632,8 @@ class VersioningService:
                 logger.warning(f"Failed to create backup version: {backup_result[1]}")
 
         # Restore the content to project
-        update_data = {field_name: content_to_restore, "updated_at": datetime.now().isoformat()}
+        # updated_at is maintained by the update_archon_projects_updated_at trigger
+        update_data = {field_name: content_to_restore}
 
         restore_result = (
             self.supabase_client.table("archon_projects")
@@ -9,7 +9,9 @@ Supports both asyncpg (K8s) and Supabase (legacy) database backends.
 """
 
 # Removed direct logging import - using unified config
+from collections.abc import Mapping
 from datetime import datetime
+from types import MappingProxyType
 
 from ..config.logfire_config import get_logger
 from ..utils import get_supabase_client
@@ -21,8 +23,13 @@ logger = get_logger(__name__)
 class PromptService:
     """Singleton service for managing AI agent prompts."""
 
+    # The singleton keeps its state on the class, so instances need no __dict__
+    __slots__ = ()
+
     _instance = None
-    _prompts: dict[str, str] = {}
+    # Replaced wholesale by each successful load and never mutated in place,
+    # so readers always see one complete, read-only snapshot
+    _prompts: Mapping[str, str] = MappingProxyType({})
     _last_loaded: datetime | None = None
 
     def __new__(cls):
@@ -45,9 +52,8 @@ class PromptService:
                 await self._load_prompts_supabase()
 
         except Exception as e:
+            # Keep serving the last loaded prompts (empty if none) rather than crash
             logger.error(f"Failed to load prompts: {e}")
-            # Continue with empty prompts rather than crash
-            self._prompts = {}
 
     async def _load_prompts_asyncpg(self) -> None:
         """Load prompts using asyncpg."""
@@ -58,8 +64,8 @@ class PromptService:
         )
 
         if rows:
-            self._prompts = {row["prompt_name"]: row["prompt"] for row in rows}
-            self._last_loaded = datetime.now()
+            type(self)._prompts = MappingProxyType({row["prompt_name"]: row["prompt"] for row in rows})
+            type(self)._last_loaded = datetime.now()
             logger.info(f"Loaded {len(self._prompts)} prompts into memory (asyncpg)")
         else:
             logger.warning("No prompts found in database")
@@ -68,13 +74,13 @@ class PromptService:
         """Load prompts using Supabase (legacy)."""
         supabase = get_supabase_client()
 
-        response = supabase.table("archon_prompts").select("*").execute()
+        response = supabase.table("archon_prompts").select("prompt_name, prompt").execute()
 
         if response.data:
-            self._prompts = {
+            type(self)._prompts = MappingProxyType({
                 prompt["prompt_name"]: prompt["prompt"] for prompt in response.data
-            }
-            self._last_loaded = datetime.now()
+            })
+            type(self)._last_loaded = datetime.now()
             logger.info(f"Loaded {len(self._prompts)} prompts into memory")
         else:
             logger.warning("No prompts found in database")
@@ -90,15 +96,13 @@ class PromptService:
         Returns:
             The prompt text or default value
         """
-        if default is None:
-            default = "You are a helpful AI assistant."
-
-        prompt = self._prompts.get(prompt_name, default)
-
-        if prompt == default and prompt_name not in self._prompts:
-            logger.warning(f"Prompt '{prompt_name}' not found, using default")
+        # Prompt texts are never None, so one lookup tells a hit from a miss
+        prompt = self._prompts.get(prompt_name)
+        if prompt is not None:
+            return prompt
 
-        return prompt
+        logger.warning(f"Prompt '{prompt_name}' not found, using default")
+        return default if default is not None else "You are a helpful AI assistant."
 
     async def reload_prompts(self) -> None:
         """
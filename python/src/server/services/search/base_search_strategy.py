@@ -7,9 +7,15 @@ This is the core semantic search functionality.
 Supports both asyncpg (K8s) and Supabase (legacy) database backends.
 """
 
-import json
+import asyncio
+import copy
+import hashlib
+import time
+from array import array
 from typing import Any
 
+import orjson
+
 from ...config.logfire_config import get_logger, safe_span
 from ..client_manager import get_database_mode, is_asyncpg_mode
 
@@ -18,6 +24,43 @@ logger = get_logger(__name__)
 # Fixed similarity threshold for vector results
 SIMILARITY_THRESHOLD = 0.05
 
+# Agent and RAG loops often repeat the exact same query embedding. Results are
+# cached briefly; ingestion and source deletion invalidate them directly, but
+# only in this process, so other workers and other write paths can serve
+# results up to the TTL old.
+_VECTOR_CACHE_TTL_SECONDS = 60
+_VECTOR_CACHE_MAX_ENTRIES = 512
+_vector_search_cache: dict[tuple, tuple[float, list[dict[str, Any]]]] = {}
+# Searches currently running, keyed like the cache, so identical concurrent
+# searches share one query. A future resolves to None if its search was cancelled.
+_vector_search_inflight: dict[tuple, asyncio.Future] = {}
+
+
+def _vector_search_cache_key(
+    query_embedding: list[float], match_count: int, filter_metadata: dict | None, table_rpc: str
+) -> tuple:
+    """Build a compact cache key; the embedding is reduced to a 128-bit digest."""
+    embedding_digest = hashlib.blake2b(array("d", query_embedding).tobytes(), digest_size=16).digest()
+    return (
+        table_rpc,
+        match_count,
+        embedding_digest,
+        orjson.dumps(filter_metadata, default=str, option=orjson.OPT_SORT_KEYS),
+    )
+
+
+def invalidate_vector_search_cache(table_rpc: str | None = None) -> None:
+    """Drop cached vector search results for one RPC, or all of them."""
+    # Searches already running may predate the change; later callers start their own
+    if table_rpc is None:
+        _vector_search_cache.clear()
+        _vector_search_inflight.clear()
+        return
+    for key in [key for key in _vector_search_cache if key[0] == table_rpc]:
+        _vector_search_cache.pop(key, None)
+    for key in [key for key in _vector_search_inflight if key[0] == table_rpc]:
+        _vector_search_inflight.pop(key, None)
+
 
 class BaseSearchStrategy:
     """Base strategy implementing fundamental vector similarity search"""
@@ -48,6 +91,9 @@ class BaseSearchStrategy:
         Perform basic vector similarity search.
 
         This is the foundational semantic search that all strategies use.
+        Results are cached for up to 60 seconds and returned as deep copies.
+        Ingestion and source deletion in this process clear the cache; changes
+        made by other workers can take up to the TTL to show.
 
         Args:
             query_embedding: The embedding vector for the query
@@ -58,6 +104,40 @@ class BaseSearchStrategy:
         Returns:
             List of matching documents with similarity scores
         """
+        cache_key = _vector_search_cache_key(query_embedding, match_count, filter_metadata, table_rpc)
+        cached = _vector_search_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < _VECTOR_CACHE_TTL_SECONDS:
+            return copy.deepcopy(cached[1])
+
+        pending = _vector_search_inflight.get(cache_key)
+        if pending is not None:
+            shared = await asyncio.shield(pending)
+            if shared is not None:
+                return copy.deepcopy(shared)
+
+        future = asyncio.get_running_loop().create_future()
+        _vector_search_inflight[cache_key] = future
+        try:
+            results = await self._vector_search_uncached(
+                cache_key, query_embedding, match_count, filter_metadata, table_rpc
+            )
+            future.set_result(copy.deepcopy(results))
+            return results
+        finally:
+            if _vector_search_inflight.get(cache_key) is future:
+                del _vector_search_inflight[cache_key]
+            if not future.done():
+                future.set_result(None)
+
+    async def _vector_search_uncached(
+        self,
+        cache_key: tuple,
+        query_embedding: list[float],
+        match_count: int,
+        filter_metadata: dict | None,
+        table_rpc: str,
+    ) -> list[dict[str, Any]]:
+        """Run the vector search against the database and cache the results."""
         with safe_span("base_vector_search", table=table_rpc, match_count=match_count) as span:
             try:
                 if is_asyncpg_mode():
@@ -69,20 +149,16 @@ class BaseSearchStrategy:
                         query_embedding, match_count, filter_metadata, table_rpc
                     )
 
-                # Filter by similarity threshold
-                filtered_results = []
-                for result in results:
-                    similarity = float(result.get("similarity", 0.0))
-                    if similarity >= SIMILARITY_THRESHOLD:
-                        filtered_results.append(result)
-
-                span.set_attribute("results_found", len(filtered_results))
-                span.set_attribute(
-                    "results_filtered",
-                    len(results) - len(filtered_results) if results else 0,
-                )
+                # Both backends return only results at or above SIMILARITY_THRESHOLD
+                span.set_attribute("results_found", len(results))
 
-                return filtered_results
+                if len(_vector_search_cache) >= _VECTOR_CACHE_MAX_ENTRIES:
+                    _vector_search_cache.clear()
+                _vector_search_cache[cache_key] = (
+                    time.monotonic(),
+                    copy.deepcopy(results),
+                )
+                return results
 
             except Exception as e:
                 logger.error(f"Vector search failed: {e}")
@@ -109,9 +185,12 @@ class BaseSearchStrategy:
                 filter_json = filter_metadata
 
         # Call the PostgreSQL function directly
-        # The embedding needs to be formatted as a PostgreSQL vector literal
-        embedding_str = "[" + ",".join(str(x) for x in query_embedding) + "]"
+        # The embedding needs to be formatted as a PostgreSQL vector literal;
+        # a JSON array of numbers ("[0.1,0.2,...]") is exactly that
+        embedding_str = orjson.dumps(query_embedding, option=orjson.OPT_SERIALIZE_NUMPY).decode()
 
+        # Apply the similarity threshold in the query so rejected rows are
+        # never sent back
         rows = await AsyncPGClient.fetch(
             f"""
             SELECT * FROM {table_rpc}(
@@ -120,8 +199,10 @@ class BaseSearchStrategy:
                 filter := $3::jsonb,
                 source_filter := $4
             )
+            WHERE similarity >= $5
             """,
-            embedding_str, match_count, json.dumps(filter_json), source_filter
+            embedding_str, match_count, filter_json, source_filter,
+            SIMILARITY_THRESHOLD
         )
 
         results = []
@@ -160,4 +241,9 @@ class BaseSearchStrategy:
         # Execute search
         response = self.supabase_client.rpc(table_rpc, rpc_params).execute()
 
-        return response.data if response.data else []
+        # Filter by similarity threshold
+        return [
+            result
+            for result in response.data or []
+            if float(result.get("similarity", 0.0)) >= SIMILARITY_THRESHOLD
+        ]
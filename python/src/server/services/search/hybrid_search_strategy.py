@@ -13,9 +13,10 @@ Strategy combines:
 Supports both asyncpg (K8s) and Supabase (legacy) database backends.
 """
 
-import json
 from typing import Any
 
+import orjson
+
 from ...config.logfire_config import get_logger, safe_span
 from ..client_manager import get_database_mode, is_asyncpg_mode
 from ..embeddings.embedding_service import create_embedding
@@ -107,8 +108,8 @@ class HybridSearchStrategy:
         filter_json = dict(filter_metadata) if filter_metadata else {}
         source_filter = filter_json.pop("source", None) if "source" in filter_json else None
 
-        # Format embedding for PostgreSQL
-        embedding_str = "[" + ",".join(str(x) for x in query_embedding) + "]"
+        # Format embedding for PostgreSQL (a JSON number array is a valid vector literal)
+        embedding_str = orjson.dumps(query_embedding, option=orjson.OPT_SERIALIZE_NUMPY).decode()
 
         rows = await AsyncPGClient.fetch(
             """
@@ -120,7 +121,7 @@ class HybridSearchStrategy:
                 source_filter := $5
             )
             """,
-            embedding_str, query, match_count, json.dumps(filter_json), source_filter
+            embedding_str, query, match_count, filter_json, source_filter
         )
 
         results = []
@@ -259,8 +260,8 @@ class HybridSearchStrategy:
         if not final_source_filter and "source" in filter_json:
             final_source_filter = filter_json.pop("source")
 
-        # Format embedding for PostgreSQL
-        embedding_str = "[" + ",".join(str(x) for x in query_embedding) + "]"
+        # Format embedding for PostgreSQL (a JSON number array is a valid vector literal)
+        embedding_str = orjson.dumps(query_embedding, option=orjson.OPT_SERIALIZE_NUMPY).decode()
 
         rows = await AsyncPGClient.fetch(
             """
@@ -272,7 +273,7 @@ class HybridSearchStrategy:
                 source_filter := $5
             )
             """,
-            embedding_str, query, match_count, json.dumps(filter_json), final_source_filter
+            embedding_str, query, match_count, filter_json, final_source_filter
         )
 
         results = []
@@ -15,6 +15,7 @@ from supabase import Client
 from ..config.logfire_config import get_logger, search_logger
 from .client_manager import get_supabase_client, get_database_mode, is_asyncpg_mode
 from .llm_provider_service import extract_message_text, get_llm_client
+from .search.base_search_strategy import invalidate_vector_search_cache
 
 logger = get_logger(__name__)
 
@@ -451,9 +452,13 @@ class SourceManagementService:
             logger.info(f"Starting delete_source for source_id: {source_id}")
 
             if is_asyncpg_mode():
-                return await self._delete_source_asyncpg(source_id)
+                result = await self._delete_source_asyncpg(source_id)
             else:
-                return self._delete_source_supabase(source_id)
+                result = self._delete_source_supabase(source_id)
+
+            # Cascaded pages and code examples must not be served from the cache
+            invalidate_vector_search_cache()
+            return result
 
         except Exception as e:
             logger.error(f"Error deleting source {source_id}: {e}")
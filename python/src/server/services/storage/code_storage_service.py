@@ -31,6 +31,7 @@ from ..llm_provider_service import (
     prepare_chat_completion_params,
     synthesize_json_from_reasoning,
 )
+from ..search.base_search_strategy import invalidate_vector_search_cache
 
 
 def _extract_json_payload(raw_response: str, context_code: str = "", language: str = "") -> str:
@@ -1497,3 +1498,5 @@ async def add_code_examples_to_supabase(
             "code_total_batches": (total_items + batch_size - 1) // batch_size,
             "code_current_batch": (total_items + batch_size - 1) // batch_size,
         })
+
+    invalidate_vector_search_cache("match_archon_code_examples")
@@ -15,6 +15,7 @@ from ...config.logfire_config import safe_span, search_logger
 from ..client_manager import get_database_mode, is_asyncpg_mode
 from ..embeddings.contextual_embedding_service import generate_contextual_embeddings_batch
 from ..embeddings.embedding_service import create_embeddings_batch
+from ..search.base_search_strategy import invalidate_vector_search_cache
 
 
 async def add_documents_to_supabase(
@@ -630,4 +631,5 @@ async def add_documents_to_supabase(
         span.set_attribute("total_processed", len(contents))
         span.set_attribute("total_stored", total_chunks_stored)
 
+        invalidate_vector_search_cache("match_archon_crawled_pages")
         return {"chunks_stored": total_chunks_stored}
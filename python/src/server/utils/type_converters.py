@@ -5,10 +5,43 @@ asyncpg returns native Python types (UUID, datetime) that need conversion
 for Pydantic models which expect strings.
 """
 
+from collections.abc import Callable, Iterable
 from datetime import datetime
 from typing import Any
 from uuid import UUID
 
+# Conversions looked up by base type when a value type is first seen
+_BASE_CONVERTERS: tuple[tuple[type, Callable[[Any], str]], ...] = (
+    (UUID, str),
+    (datetime, datetime.isoformat),
+)
+
+
+def _uuid_to_str(value: UUID) -> str:
+    """Format a stdlib UUID from its 128-bit int, skipping UUID.__str__."""
+    digits = f"{value.int:032x}"
+    return f"{digits[:8]}-{digits[8:12]}-{digits[12:16]}-{digits[16:20]}-{digits[20:]}"
+
+
+# Conversion per exact value type (None: keep the value as is). asyncpg returns
+# its own UUID subclass, whose C-level __str__ is faster than _uuid_to_str, so
+# subclasses are resolved once by _converter_for and keep str().
+_CONVERTERS: dict[type, Callable[[Any], str] | None] = {
+    UUID: _uuid_to_str,
+    datetime: datetime.isoformat,
+}
+
+
+def _converter_for(value_type: type) -> Callable[[Any], str] | None:
+    """Resolve and cache the conversion for a value type not seen before."""
+    converter = None
+    for base, base_converter in _BASE_CONVERTERS:
+        if issubclass(value_type, base):
+            converter = base_converter
+            break
+    _CONVERTERS[value_type] = converter
+    return converter
+
 
 def row_to_dict(row: Any) -> dict[str, Any]:
     """
@@ -21,13 +54,47 @@ def row_to_dict(row: Any) -> dict[str, Any]:
     if row is None:
         return {}
 
-    result = dict(row)
-    for key, value in result.items():
-        if isinstance(value, UUID):
-            result[key] = str(value)
-        elif isinstance(value, datetime):
-            result[key] = value.isoformat()
-    return result
+    return row_to_dict_inplace(dict(row))
+
+
+def row_to_dict_inplace(row: dict[str, Any]) -> dict[str, Any]:
+    """
+    Convert like row_to_dict, but in place on a dict the caller owns.
+
+    AsyncPGClient.fetch/fetchrow already return fresh dicts, so their rows can
+    be converted without another copy. Returns the same dict.
+    """
+    converters = _CONVERTERS
+    for key, value in row.items():
+        value_type = type(value)
+        converter = converters[value_type] if value_type in converters else _converter_for(value_type)
+        if converter is not None:
+            row[key] = converter(value)
+    return row
+
+
+def rows_to_dicts(rows: Iterable[Any]) -> list[dict[str, Any]]:
+    """
+    Convert a result set like row_to_dict, resolving each column's conversion once.
+
+    A column's conversion is looked up again only when its value type changes,
+    e.g. from None to UUID.
+    """
+    converters = _CONVERTERS
+    column_converters: dict[str, tuple[type, Callable[[Any], str] | None]] = {}
+    results = []
+    for row in rows:
+        result = dict(row)
+        for key, value in result.items():
+            value_type = type(value)
+            column = column_converters.get(key)
+            if column is None or column[0] is not value_type:
+                converter = converters[value_type] if value_type in converters else _converter_for(value_type)
+                column = column_converters[key] = (value_type, converter)
+            if column[1] is not None:
+                result[key] = column[1](value)
+        results.append(result)
+    return results
 
 
 def get_now() -> datetime:
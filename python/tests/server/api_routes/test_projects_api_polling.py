@@ -154,6 +154,37 @@ class TestProjectsListPolling:
             assert response2.status_code == 304
             assert response2.content == b""
 
+    def test_get_projects_details_uses_bulk_lookup(self, test_client):
+        """Test that project details for several IDs are fetched in one service call."""
+        with patch("src.server.api_routes.projects_api.ProjectService") as mock_proj_class:
+            mock_proj_service = MagicMock()
+            mock_proj_class.return_value = mock_proj_service
+            projects = [{"id": "proj-2", "title": "Second"}, {"id": "proj-1", "title": "First"}]
+            mock_proj_service.get_projects_bulk = AsyncMock(
+                return_value=(True, {"projects": projects, "total_count": 2})
+            )
+
+            response = test_client.get("/api/projects/details?ids=proj-2&ids=proj-1")
+
+            assert response.status_code == 200
+            assert response.json()["projects"] == projects
+            mock_proj_service.get_projects_bulk.assert_awaited_once_with(["proj-2", "proj-1"])
+
+    def test_stream_projects_ndjson(self, test_client):
+        """Test that the stream endpoint returns one JSON project per line."""
+        async def fake_stream():
+            yield b'{"id": "proj-1"}\n'
+            yield b'{"id": "proj-2"}\n'
+
+        with patch("src.server.api_routes.projects_api.ProjectService") as mock_proj_class:
+            mock_proj_class.return_value.iter_projects_ndjson = fake_stream
+
+            response = test_client.get("/api/projects/stream")
+
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("application/x-ndjson")
+            assert response.text.splitlines() == ['{"id": "proj-1"}', '{"id": "proj-2"}']
+
 
 class TestProjectTasksPolling:
     """Tests for project tasks endpoint with polling support."""
@@ -266,6 +297,23 @@ class TestProjectTasksPolling:
                     assert response.content == b""
 
 
+    def test_get_project_dashboard(self, test_client):
+        """Test that the dashboard returns the project's tasks with its counts."""
+        with patch("src.server.api_routes.projects_api.TaskService") as mock_task_class:
+            mock_task_service = MagicMock()
+            mock_task_class.return_value = mock_task_service
+            dashboard = {
+                "tasks": [{"id": "task-1", "title": "Test Task", "status": "todo"}],
+                "counts": {"todo": 1, "doing": 0, "done": 0},
+            }
+            mock_task_service.get_project_dashboard = AsyncMock(return_value=(True, dashboard))
+
+            response = test_client.get("/api/projects/proj-1/dashboard")
+
+            assert response.status_code == 200
+            assert response.json() == dashboard
+            mock_task_service.get_project_dashboard.assert_awaited_once_with("proj-1")
+
 class TestPollingEdgeCases:
     """Test edge cases in polling implementation."""
 
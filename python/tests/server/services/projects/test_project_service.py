@@ -0,0 +1,96 @@
+"""Tests for ProjectService."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, patch
+from uuid import UUID
+
+import pytest
+
+from src.server.services.projects.project_service import ProjectService
+
+PROJECT_ID = "550e8400-e29b-41d4-a716-446655440000"
+
+
+@pytest.fixture
+def service():
+    """Create a ProjectService in asyncpg mode."""
+    with patch(
+        "src.server.services.projects.project_service.get_database_mode",
+        return_value="asyncpg",
+    ):
+        return ProjectService()
+
+
+@pytest.mark.asyncio
+async def test_get_projects_bulk_normalises_ids(service):
+    """Upper-case and repeated IDs resolve to one project; malformed IDs are skipped."""
+    row = {
+        "id": UUID(PROJECT_ID),
+        "title": "Project",
+        "created_at": None,
+        "updated_at": None,
+    }
+    fetch = AsyncMock(return_value=[row])
+
+    with patch("src.server.services.projects.project_service.AsyncPGClient.fetch", fetch):
+        success, result = await service.get_projects_bulk(
+            [PROJECT_ID.upper(), "nope", PROJECT_ID]
+        )
+
+    assert success
+    fetch.assert_awaited_once()
+    assert fetch.await_args.args[1] == [PROJECT_ID]
+    assert [project["id"] for project in result["projects"]] == [PROJECT_ID]
+
+
+@pytest.mark.asyncio
+async def test_get_projects_bulk_only_malformed_ids(service):
+    """Malformed IDs alone return no projects without querying."""
+    fetch = AsyncMock()
+
+    with patch("src.server.services.projects.project_service.AsyncPGClient.fetch", fetch):
+        success, result = await service.get_projects_bulk(["nope"])
+
+    assert success
+    assert result == {"projects": [], "total_count": 0}
+    fetch.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_delete_project_invalidates_task_caches(service):
+    """Deleting a project drops cached tasks and counts, as its tasks cascade."""
+    fetchrow = AsyncMock(return_value={"deleted_count": 1, "tasks_count": 2})
+
+    with patch("src.server.services.projects.project_service.AsyncPGClient.fetchrow", fetchrow), \
+         patch("src.server.services.projects.project_service.invalidate_task_caches") as invalidate:
+        success, result = await service.delete_project(PROJECT_ID)
+
+    assert success
+    assert result["deleted_tasks"] == 2
+    invalidate.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_update_project_formats_returned_row(service):
+    """The updated row is converted like every other fetched project."""
+    updated_at = datetime(2024, 1, 1, 12, tzinfo=UTC)
+    row = {
+        "id": UUID(PROJECT_ID),
+        "title": "Renamed",
+        "docs": None,
+        "features": [{"name": "a"}],
+        "data": None,
+        "created_at": updated_at,
+        "updated_at": updated_at,
+    }
+    fetchrow = AsyncMock(return_value=row)
+
+    with patch("src.server.services.projects.project_service.AsyncPGClient.fetchrow", fetchrow):
+        success, result = await service.update_project(PROJECT_ID, {"title": "Renamed"})
+
+    assert success
+    project = result["project"]
+    assert project["id"] == PROJECT_ID
+    assert project["updated_at"] == updated_at.isoformat()
+    assert project["docs"] == []
+    assert project["features"] == [{"name": "a"}]
@@ -0,0 +1,108 @@
+"""Tests for SourceLinkingService."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.server.services.projects import source_linking_service
+from src.server.services.projects.source_linking_service import SourceLinkingService
+
+PROJECT_1 = "550e8400-e29b-41d4-a716-446655440001"
+PROJECT_2 = "550e8400-e29b-41d4-a716-446655440002"
+PROJECT_3 = "550e8400-e29b-41d4-a716-446655440003"
+
+
+@pytest.fixture(autouse=True)
+def clear_sources_cache():
+    """Keep the module-level sources cache from leaking between tests."""
+    source_linking_service._sources_cache.clear()
+    yield
+    source_linking_service._sources_cache.clear()
+
+
+@pytest.fixture
+def service():
+    """Create a SourceLinkingService in asyncpg mode."""
+    with patch(
+        "src.server.services.projects.source_linking_service.get_database_mode",
+        return_value="asyncpg",
+    ):
+        return SourceLinkingService()
+
+
+@pytest.mark.asyncio
+async def test_format_projects_with_sources_uses_one_query(service):
+    """Sources for every project are fetched once and bucketed per project and type."""
+    rows = [
+        {"project_id": PROJECT_1, "source_id": "src-a", "notes": "technical"},
+        {"project_id": PROJECT_1, "source_id": "src-b", "notes": "business"},
+        {"project_id": PROJECT_2, "source_id": "src-c", "notes": "technical"},
+    ]
+    projects = [
+        {"id": PROJECT_1, "title": "First"},
+        {"id": PROJECT_2, "title": "Second"},
+        {"id": PROJECT_3, "title": "Third"},
+    ]
+
+    with patch.object(
+        service, "_get_sources_for_projects_asyncpg", AsyncMock(return_value=rows)
+    ) as mock_fetch:
+        formatted = await service.format_projects_with_sources(projects)
+
+    mock_fetch.assert_awaited_once_with([PROJECT_1, PROJECT_2, PROJECT_3])
+    assert [p["title"] for p in formatted] == ["First", "Second", "Third"]
+    assert formatted[0]["technical_sources"] == ["src-a"]
+    assert formatted[0]["business_sources"] == ["src-b"]
+    assert formatted[1]["technical_sources"] == ["src-c"]
+    assert formatted[1]["business_sources"] == []
+    assert formatted[2]["technical_sources"] == []
+
+
+@pytest.mark.asyncio
+async def test_format_projects_with_sources_falls_back_to_empty_sources(service):
+    """A failed source lookup still returns the projects, without sources."""
+    with patch.object(
+        service,
+        "_get_sources_for_projects_asyncpg",
+        AsyncMock(side_effect=ConnectionError("database unavailable")),
+    ):
+        formatted = await service.format_projects_with_sources([{"id": PROJECT_1, "title": "First"}])
+
+    assert formatted[0]["technical_sources"] == []
+    assert formatted[0]["business_sources"] == []
+
+
+@pytest.mark.asyncio
+async def test_get_sources_for_projects_accepts_non_canonical_ids(service):
+    """Upper-case IDs get the rows returned under the canonical ID; malformed IDs are skipped."""
+    rows = [{"project_id": PROJECT_1, "source_id": "src-a", "notes": "technical"}]
+
+    with patch.object(
+        service, "_get_sources_for_projects_asyncpg", AsyncMock(return_value=rows)
+    ) as mock_fetch:
+        sources = await service.get_sources_for_projects([PROJECT_1.upper(), "nope"])
+
+    mock_fetch.assert_awaited_once_with([PROJECT_1])
+    assert sources == {
+        PROJECT_1.upper(): {"technical_sources": ["src-a"], "business_sources": []},
+        "nope": {"technical_sources": [], "business_sources": []},
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_project_sources_is_cached_until_update(service):
+    """Repeated reads hit the cache; updating the links invalidates it."""
+    sources = {"technical_sources": ["src-a"], "business_sources": []}
+    with patch.object(
+        service, "_get_project_sources_asyncpg", AsyncMock(return_value=(True, sources))
+    ) as mock_get, patch.object(
+        service, "_update_project_sources_asyncpg", AsyncMock(return_value=(True, {}))
+    ):
+        first = await service.get_project_sources("proj-1")
+        second = await service.get_project_sources("proj-1")
+        assert first == second == (True, sources)
+        assert mock_get.await_count == 1
+
+        await service.update_project_sources("proj-1", technical_sources=["src-b"])
+        await service.get_project_sources("proj-1")
+        assert mock_get.await_count == 2
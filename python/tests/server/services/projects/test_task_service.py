@@ -0,0 +1,55 @@
+"""Tests for TaskService."""
+
+import copy
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.server.services.projects import task_service
+from src.server.services.projects.task_service import TaskService
+
+
+@pytest.fixture(autouse=True)
+def clear_task_caches():
+    """Keep the module-level task caches from leaking between tests."""
+    task_service.invalidate_task_caches()
+    yield
+    task_service.invalidate_task_caches()
+
+
+@pytest.fixture
+def service():
+    """Create a TaskService in asyncpg mode."""
+    with patch(
+        "src.server.services.projects.task_service.get_database_mode",
+        return_value="asyncpg",
+    ):
+        yield TaskService()
+
+
+@pytest.mark.asyncio
+async def test_get_task_is_cached_until_update(service):
+    """Repeated reads hit the cache; updating the task invalidates it."""
+    row = {
+        "id": "task-1",
+        "title": "First",
+        "created_at": "2024-01-01T00:00:00+00:00",
+        "updated_at": "2024-01-01T00:00:00+00:00",
+        "sources": [{"url": "a"}],
+        "code_examples": [],
+    }
+    fetchrow = AsyncMock(side_effect=lambda *args: copy.deepcopy(row))
+
+    with patch("src.server.services.projects.task_service.is_asyncpg_mode", return_value=True), \
+         patch("src.server.services.database.AsyncPGClient.fetchrow", fetchrow), \
+         patch.object(service, "_update_task_asyncpg", AsyncMock(return_value=(True, {}))):
+        first = await service.get_task("task-1")
+        first[1]["task"]["title"] = "Changed by caller"
+        first[1]["task"]["sources"].append({"url": "b"})
+        second = await service.get_task("task-1")
+        assert second == (True, {"task": row})
+        assert fetchrow.await_count == 1
+
+        await service.update_task("task-1", {"title": "Renamed"})
+        await service.get_task("task-1")
+        assert fetchrow.await_count == 2
@@ -0,0 +1,102 @@
+"""Tests for VersioningService."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.server.services.projects.versioning_service import VersioningService
+
+
+@pytest.fixture
+def service():
+    """Create a VersioningService in asyncpg mode."""
+    with patch(
+        "src.server.services.projects.versioning_service.get_database_mode",
+        return_value="asyncpg",
+    ), patch(
+        "src.server.services.projects.versioning_service.is_asyncpg_mode",
+        return_value=True,
+    ):
+        yield VersioningService()
+
+
+@pytest.mark.asyncio
+async def test_list_versions_bulk_uses_one_query(service):
+    """Versions for every project are fetched once and grouped per project."""
+    rows = [
+        {"id": "v-3", "project_id": "proj-1", "version_number": 2},
+        {"id": "v-2", "project_id": "proj-2", "version_number": 1},
+        {"id": "v-1", "project_id": "proj-1", "version_number": 1},
+    ]
+    fetch = AsyncMock(return_value=rows)
+
+    with patch("src.server.services.database.AsyncPGClient.fetch", fetch):
+        success, result = await service.list_versions_bulk(["proj-1", "proj-2", "proj-3"], "docs")
+
+    assert success
+    fetch.assert_awaited_once()
+    assert fetch.await_args.args[1:] == (["proj-1", "proj-2", "proj-3"], "docs")
+    versions = result["versions"]
+    assert [v["id"] for v in versions["proj-1"]] == ["v-3", "v-1"]
+    assert [v["id"] for v in versions["proj-2"]] == ["v-2"]
+    assert "proj-3" not in versions
+
+
+@pytest.mark.asyncio
+async def test_list_versions_accepts_non_canonical_project_id(service):
+    """An upper-case project id still returns the rows keyed by the canonical id."""
+    project_id = "550e8400-e29b-41d4-a716-446655440000"
+    rows = [
+        {"id": "v-2", "project_id": project_id, "version_number": 2},
+        {"id": "v-1", "project_id": project_id, "version_number": 1},
+    ]
+    fetch = AsyncMock(return_value=rows)
+
+    with patch("src.server.services.database.AsyncPGClient.fetch", fetch):
+        success, result = await service.list_versions(project_id.upper(), "docs")
+
+    assert success
+    assert [v["id"] for v in result["versions"]] == ["v-2", "v-1"]
+    assert result["total_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_create_versions_bulk_uses_one_insert(service):
+    """All snapshots go in with one insert, with content passed as JSON text."""
+    created = [
+        {"id": "v-1", "project_id": "proj-1", "field_name": "docs", "version_number": 2},
+        {"id": "v-2", "project_id": "proj-1", "field_name": "features", "version_number": 1},
+    ]
+    fetch = AsyncMock(return_value=created)
+
+    with patch("src.server.services.database.AsyncPGClient.fetch", fetch):
+        success, result = await service.create_versions_bulk([
+            {"project_id": "proj-1", "field_name": "docs", "content": [{"id": "doc-1"}]},
+            {
+                "project_id": "proj-1",
+                "field_name": "features",
+                "content": {"a": 1},
+                "change_summary": "Updated features",
+            },
+        ])
+
+    assert success
+    assert result == {"versions": created, "count": 2}
+    fetch.assert_awaited_once()
+    args = fetch.await_args.args[1:]
+    assert args[1] == ("docs", "features")
+    assert args[2] == ['[{"id":"doc-1"}]', '{"a":1}']
+    assert args[3] == ("Update docs", "Updated features")
+
+
+@pytest.mark.asyncio
+async def test_create_versions_bulk_empty(service):
+    """No snapshots means no query."""
+    fetch = AsyncMock()
+
+    with patch("src.server.services.database.AsyncPGClient.fetch", fetch):
+        success, result = await service.create_versions_bulk([])
+
+    assert success
+    assert result == {"versions": [], "count": 0}
+    fetch.assert_not_awaited()
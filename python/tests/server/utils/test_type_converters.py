@@ -3,7 +3,12 @@
 from datetime import datetime
 from uuid import UUID
 
-from src.server.utils.type_converters import get_now, row_to_dict
+from src.server.utils.type_converters import (
+    get_now,
+    row_to_dict,
+    row_to_dict_inplace,
+    rows_to_dicts,
+)
 
 
 def test_row_to_dict_converts_uuid():
@@ -63,6 +68,43 @@ def test_row_to_dict_handles_mixed_types():
     assert result["title"] == "Test Task"
 
 
+def test_row_to_dict_converts_uuid_subclasses():
+    """Test that UUID subclasses, like asyncpg's own UUID type, are converted too."""
+
+    class RecordUUID(UUID):
+        pass
+
+    row = {"id": RecordUUID("550e8400-e29b-41d4-a716-446655440000")}
+    result = row_to_dict(row)
+    assert result["id"] == "550e8400-e29b-41d4-a716-446655440000"
+    assert type(result["id"]) is str
+
+
+def test_row_to_dict_inplace_converts_the_given_dict():
+    """Test that in-place conversion updates and returns the caller's dict."""
+    now = datetime.now()
+    row = {"id": UUID("550e8400-e29b-41d4-a716-446655440000"), "created_at": now, "count": 1}
+    expected = row_to_dict(row)
+    result = row_to_dict_inplace(row)
+    assert result is row
+    assert result == expected
+
+
+def test_rows_to_dicts_converts_every_row():
+    """Test batch conversion, including columns whose type changes between rows."""
+    now = datetime.now()
+    uid = UUID("550e8400-e29b-41d4-a716-446655440000")
+    rows = [
+        {"id": uid, "parent_id": None, "created_at": now},
+        {"id": uid, "parent_id": uid, "created_at": now},
+    ]
+    result = rows_to_dicts(rows)
+    assert result == [row_to_dict(row) for row in rows]
+    assert result[0]["parent_id"] is None
+    assert result[1]["parent_id"] == "550e8400-e29b-41d4-a716-446655440000"
+    assert rows_to_dicts([]) == []
+
+
 def test_get_now_returns_datetime():
     """Test that get_now returns a datetime object."""
     result = get_now()
@@ -75,3 +117,4 @@ def test_get_now_returns_current_time():
     result = get_now()
     after = datetime.now()
     assert before <= result <= after
+
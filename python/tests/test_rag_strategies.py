@@ -6,6 +6,7 @@ Updated to match current async-only architecture.
 """
 
 import asyncio
+import copy
 import os
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -169,6 +170,80 @@ class TestHybridSearchStrategy:
         assert hasattr(hybrid_strategy, "search_code_examples_hybrid")
 
 
+class TestBaseSearchStrategy:
+    """Test base vector search strategy"""
+
+    @pytest.fixture
+    def base_strategy(self):
+        """Create BaseSearchStrategy instance with an empty result cache"""
+        from src.server.services.search import base_search_strategy
+
+        base_search_strategy.invalidate_vector_search_cache()
+        yield base_search_strategy.BaseSearchStrategy(MagicMock())
+        base_search_strategy.invalidate_vector_search_cache()
+
+    @pytest.mark.asyncio
+    async def test_vector_search_caches_until_invalidated(self, base_strategy):
+        """Test identical searches are served from the cache until invalidated"""
+        from src.server.services.search.base_search_strategy import invalidate_vector_search_cache
+
+        rows = [{"id": "doc-1", "content": "hit", "similarity": 0.9, "metadata": {"tag": "a"}}]
+        with (
+            patch(
+                "src.server.services.search.base_search_strategy.is_asyncpg_mode",
+                return_value=False,
+            ),
+            patch.object(
+                base_strategy,
+                "_vector_search_supabase",
+                side_effect=lambda *args: copy.deepcopy(rows),
+            ) as mock_rpc,
+        ):
+            first = await base_strategy.vector_search([0.1, 0.2], match_count=5)
+            first[0]["content"] = "changed by caller"
+            first[0]["metadata"]["tag"] = "changed by caller"
+            second = await base_strategy.vector_search([0.1, 0.2], match_count=5)
+            await base_strategy.vector_search([0.1, 0.3], match_count=5)
+            assert second == rows
+            assert mock_rpc.call_count == 2
+
+            invalidate_vector_search_cache("match_archon_crawled_pages")
+            await base_strategy.vector_search([0.1, 0.2], match_count=5)
+            assert mock_rpc.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_searches_share_one_query(self, base_strategy):
+        """Test identical searches running at the same time hit the database once"""
+        rows = [{"id": "doc-1", "content": "hit", "similarity": 0.9}]
+        release = asyncio.Event()
+
+        async def slow_search(*args):
+            await release.wait()
+            return [dict(row) for row in rows]
+
+        with (
+            patch(
+                "src.server.services.search.base_search_strategy.is_asyncpg_mode",
+                return_value=True,
+            ),
+            patch.object(
+                base_strategy, "_vector_search_asyncpg", side_effect=slow_search
+            ) as mock_query,
+        ):
+            searches = [
+                asyncio.create_task(base_strategy.vector_search([0.1, 0.2], match_count=5))
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*searches)
+
+        assert mock_query.call_count == 1
+        assert results == [rows, rows, rows]
+        results[0][0]["content"] = "changed by caller"
+        assert results[1] == rows
+
+
 class TestRerankingStrategy:
     """Test reranking strategy implementation"""
 
@@ -3,6 +3,18 @@
 import time
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from src.server.services.projects import task_service
+
+
+@pytest.fixture(autouse=True)
+def clear_task_caches():
+    """Keep cached counts from one test from answering the next."""
+    task_service.invalidate_task_caches()
+    yield
+    task_service.invalidate_task_caches()
+
 
 def test_batch_task_counts_endpoint_exists(client):
     """Test that batch task counts endpoint exists and responds."""